@@ -1,11 +1,56 @@
-"""Factories for Clean Interfaces agents."""
+"""Factories for Clean Interfaces agents.
 
-from clean_interfaces.agents.coding import create_coding_agent
-from clean_interfaces.agents.repo_qa import create_repository_qa_agent
-from clean_interfaces.agents.serena_coder import create_serena_coder_agent
+Factories are resolved lazily on first attribute access so that importing the
+package does not pull in agno, the OpenAI SDK, or the MCP toolkits.
+"""
 
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from clean_interfaces.agents.cache import clear_agent_cache, close_all_walkers
+    from clean_interfaces.agents.coding import create_coding_agent
+    from clean_interfaces.agents.repo_qa import create_repository_qa_agent
+    from clean_interfaces.agents.serena_coder import create_serena_coder_agent
+
+_LAZY: dict[str, tuple[str, str]] = {
+    "clear_agent_cache": ("clean_interfaces.agents.cache", "clear_agent_cache"),
+    "close_all_walkers": ("clean_interfaces.agents.cache", "close_all_walkers"),
+    "create_coding_agent": ("clean_interfaces.agents.coding", "create_coding_agent"),
+    "create_repository_qa_agent": (
+        "clean_interfaces.agents.repo_qa",
+        "create_repository_qa_agent",
+    ),
+    "create_serena_coder_agent": (
+        "clean_interfaces.agents.serena_coder",
+        "create_serena_coder_agent",
+    ),
+}
+
+__all__ = (
+    "clear_agent_cache",
+    "close_all_walkers",
     "create_coding_agent",
     "create_repository_qa_agent",
     "create_serena_coder_agent",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested factory on first access and cache it."""
+    try:
+        module_name, attribute = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved factories in ``dir()`` output."""
+    return sorted({*globals(), *_LAZY})
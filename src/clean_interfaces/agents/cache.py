@@ -0,0 +1,144 @@
+"""Process-wide memoisation of constructed agno agents.
+
+Building an agent creates a fresh model client (and, for MCP-backed agents, a
+new toolkit), so repeated factory calls with identical configuration reuse the
+previously built instance. MCP toolkits are cached separately so that agents
+sharing a walker configuration also share one LSP server process. The cache
+assumes settings objects are not mutated after construction within a process;
+call :func:`clear_agent_cache` after changing configuration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import hashlib
+import inspect
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from agno.tools.mcp import MCPTools
+    from pydantic import BaseModel
+
+    from clean_interfaces.mcp.base import BaseLSPWalker
+
+_MAX_CACHED_AGENTS = 32
+
+_agents: OrderedDict[Hashable, Any] = OrderedDict()
+_lock = threading.Lock()
+
+_walkers: dict[Hashable, tuple[BaseLSPWalker, MCPTools]] = {}
+_walkers_lock = threading.Lock()
+
+
+def lazy_openai_responses(module_name: str) -> Callable[[str], Any]:
+    """Return a module ``__getattr__`` that imports ``OpenAIResponses`` lazily.
+
+    The class is stored on ``module_name`` on first access. Callers resolve it
+    as ``sys.modules[__name__].OpenAIResponses`` rather than by bare name, so
+    the first lookup reaches this hook and a patched
+    ``<module>.OpenAIResponses`` is honoured.
+    """
+
+    def module_getattr(name: str) -> Any:
+        if name == "OpenAIResponses":
+            from agno.models.openai.responses import OpenAIResponses
+
+            setattr(sys.modules[module_name], name, OpenAIResponses)
+            return OpenAIResponses
+        msg = f"module {module_name!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    return module_getattr
+
+
+def settings_fingerprint(settings: BaseModel) -> tuple[tuple[str, Any], ...]:
+    """Return a hashable snapshot of the given settings' field values."""
+    return tuple(settings.model_dump().items())
+
+
+def instructions_digest(instructions: str) -> str:
+    """Return a compact digest identifying the given instructions."""
+    return hashlib.blake2b(instructions.encode(), digest_size=16).hexdigest()
+
+
+def project_fingerprint(project_path: Path | None) -> str:
+    """Return the resolved project directory, defaulting to the working directory.
+
+    Walkers launched without a project path serve the current directory, so
+    the key must change when the process changes directory.
+    """
+    return str((project_path or Path.cwd()).resolve())
+
+
+def get_or_create_agent[T](key: Hashable, factory: Callable[[], T]) -> T:
+    """Return the agent cached under ``key``, building it on first use."""
+    with _lock:
+        if key in _agents:
+            _agents.move_to_end(key)
+            return _agents[key]
+
+    agent = factory()
+
+    with _lock:
+        _agents[key] = agent
+        _agents.move_to_end(key)
+        while len(_agents) > _MAX_CACHED_AGENTS:
+            _agents.popitem(last=False)
+    return agent
+
+
+def clear_agent_cache() -> None:
+    """Drop every cached agent instance."""
+    with _lock:
+        _agents.clear()
+
+
+def get_or_create_toolkit(
+    mcp_settings: BaseModel,
+    project_path: Path | None,
+    walker_factory: Callable[[], BaseLSPWalker],
+) -> MCPTools:
+    """Return the MCP toolkit for a walker configuration, building it once.
+
+    Each cached walker keeps its LSP server process alive. Entries are not
+    evicted because cached agents may still hold their toolkits, so
+    :func:`close_all_walkers` (also run at exit) is the only cleanup.
+    """
+    key = (settings_fingerprint(mcp_settings), project_fingerprint(project_path))
+    with _walkers_lock:
+        cached = _walkers.get(key)
+        if cached is not None:
+            return cached[1]
+
+        walker = walker_factory()
+        toolkit = walker.create_toolkit()
+        _walkers[key] = (walker, toolkit)
+    return toolkit
+
+
+def close_all_walkers() -> None:
+    """Close every cached walker toolkit and forget them."""
+    with _walkers_lock:
+        entries = list(_walkers.values())
+        _walkers.clear()
+
+    for walker, toolkit in entries:
+        for resource in (toolkit, walker):
+            close = getattr(resource, "close", None)
+            if not callable(close):
+                continue
+            with contextlib.suppress(Exception):
+                result = close()
+                if inspect.iscoroutine(result):
+                    asyncio.run(result)
+
+
+atexit.register(close_all_walkers)
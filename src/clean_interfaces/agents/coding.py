@@ -1,21 +1,51 @@
 """Factories for agno-based coding agents."""
 
-from agno.agent import Agent
-from agno.models.openai.responses import OpenAIResponses
+from __future__ import annotations
 
-from clean_interfaces.llm import create_model
+import sys
+from typing import TYPE_CHECKING
 
-from clean_interfaces.utils.settings import AgentSettings
+from .cache import (
+    get_or_create_agent,
+    instructions_digest,
+    lazy_openai_responses,
+    settings_fingerprint,
+)
+
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
+    from clean_interfaces.utils.settings import AgentSettings
+
+
+__getattr__ = lazy_openai_responses(__name__)
 
 
 def create_coding_agent(*, settings: AgentSettings, instructions: str) -> Agent:
+    """Return a configured agno coding agent, reusing a cached instance."""
+    key = (
+        "coding",
+        settings_fingerprint(settings),
+        instructions_digest(instructions),
+    )
+    return get_or_create_agent(
+        key,
+        lambda: _build_coding_agent(settings=settings, instructions=instructions),
+    )
+
+
+def _build_coding_agent(*, settings: AgentSettings, instructions: str) -> Agent:
     """Create a configured agno coding agent instance."""
+    from agno.agent import Agent
+
     if getattr(settings, "provider", "openai") == "openai":
-        model = OpenAIResponses(
+        openai_responses = sys.modules[__name__].OpenAIResponses
+        model = openai_responses(
             id=settings.openai_model,
             api_key=settings.openai_api_key,
         )
     else:
+        from clean_interfaces.llm import create_model
+
         model = create_model(settings)
     return Agent(model=model, name=settings.agent_name, instructions=instructions)
-
@@ -2,38 +2,83 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
-from agno.agent import Agent
-from agno.models.openai.responses import OpenAIResponses
-
 from clean_interfaces.mcp import create_lsp_walker
-from clean_interfaces.llm import create_model
+
+from .cache import (
+    get_or_create_agent,
+    get_or_create_toolkit,
+    instructions_digest,
+    lazy_openai_responses,
+    project_fingerprint,
+    settings_fingerprint,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from agno.agent import Agent
+
     from clean_interfaces.utils.settings import AgentSettings, MCPSettings
 
 
+__getattr__ = lazy_openai_responses(__name__)
+
+
 def create_serena_coder_agent(
     *,
     settings: AgentSettings,
     mcp_settings: MCPSettings,
     instructions: str,
     project_path: Path | None = None,
+) -> Agent:
+    """Return a Serena coding agent, reusing a cached instance."""
+    key = (
+        "serena_coder",
+        settings_fingerprint(settings),
+        settings_fingerprint(mcp_settings),
+        instructions_digest(instructions),
+        project_fingerprint(project_path),
+    )
+    return get_or_create_agent(
+        key,
+        lambda: _build_serena_coder_agent(
+            settings=settings,
+            mcp_settings=mcp_settings,
+            instructions=instructions,
+            project_path=project_path,
+        ),
+    )
+
+
+def _build_serena_coder_agent(
+    *,
+    settings: AgentSettings,
+    mcp_settings: MCPSettings,
+    instructions: str,
+    project_path: Path | None = None,
 ) -> Agent:
     """Create an agent configured for Serena-assisted coding workflows."""
+    from agno.agent import Agent
+
     if getattr(settings, "provider", "openai") == "openai":
-        model = OpenAIResponses(
+        openai_responses = sys.modules[__name__].OpenAIResponses
+        model = openai_responses(
             id=settings.openai_model,
             api_key=settings.openai_api_key,
         )
     else:
+        from clean_interfaces.llm import create_model
+
         model = create_model(settings)
 
-    walker = create_lsp_walker(mcp_settings, project_path=project_path)
-    toolkit = walker.create_toolkit()
+    toolkit = get_or_create_toolkit(
+        mcp_settings,
+        project_path,
+        lambda: create_lsp_walker(mcp_settings, project_path=project_path),
+    )
 
     return Agent(
         model=model,
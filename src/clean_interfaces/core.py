@@ -2,27 +2,38 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
-
-from clean_interfaces.agents import (
-    create_coding_agent,
-    create_repository_qa_agent,
-    create_serena_coder_agent,
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Protocol,
+    cast,
+    overload,
 )
+
+from clean_interfaces.agents.cache import settings_fingerprint
 from clean_interfaces.prompts import load_prompt
 from clean_interfaces.utils.settings import get_agent_settings, get_mcp_settings
-from clean_interfaces.workflow import create_tdd_workflow
-from clean_interfaces.workflow.tdd import TDDWorkflowConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
     from pathlib import Path
 
     from agno.run.workflow import WorkflowRunOutput
 
+    from clean_interfaces.utils.settings import AgentSettings
+
 
 class AgentConfigurationError(RuntimeError):
     """Raised when the agent cannot be configured correctly."""
 
+    __slots__ = ()
+
     def __init__(self, message: str | None = None) -> None:
         """Initialise the configuration error with an optional message."""
         default_message = "OpenAI API key not configured."
@@ -32,8 +43,9 @@ class AgentConfigurationError(RuntimeError):
 class AgentExecutionError(RuntimeError):
     """Raised when the agent fails while generating a response."""
 
+    __slots__ = ()
+
 
-@runtime_checkable
 class SupportsStringContent(Protocol):
     """Protocol representing agno responses that expose string content."""
 
@@ -45,34 +57,204 @@ class SupportsStringContent(Protocol):
 class SupportsAgentRun(Protocol):
     """Protocol capturing the subset of the agno Agent interface we rely on."""
 
+    @overload
+    def run(
+        self,
+        prompt: str,
+        *,
+        stream: Literal[False] | None = None,
+    ) -> SupportsStringContent | str: ...
+
+    @overload
+    def run(self, prompt: str, *, stream: Literal[True]) -> Iterator[object]: ...
+
     def run(
         self,
         prompt: str,
         *,
         stream: bool | None = None,
-    ) -> SupportsStringContent | str:
+    ) -> SupportsStringContent | str | Iterator[object]:
         """Execute the agent and return its response."""
         ...
 
+    async def arun(
+        self,
+        prompt: str,
+        *,
+        stream: Literal[False] | None = None,
+    ) -> SupportsStringContent | str:
+        """Execute the agent asynchronously and return its response."""
+        ...
+
+
+_response_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_response_cache_lock = threading.Lock()
+_response_extractors: dict[type, Callable[[Any], str]] = {}
+
 
 def run_coding_agent(prompt: str) -> str:
-    """Execute the agno coding agent and return its response text."""
-    settings = get_agent_settings()
-    if not settings.openai_api_key:
-        raise AgentConfigurationError
+    """Execute the agno coding agent and return its response text.
+
+    When ``AgentSettings.response_cache_ttl_sec`` is positive, responses for
+    identical prompts are served from an in-process cache until they expire.
+    """
+    return _run_coding_agent(_require_configured_settings(), prompt)
+
+
+def _run_coding_agent(settings: AgentSettings, prompt: str) -> str:
+    """Run the coding agent with already validated settings."""
+    from clean_interfaces.agents import create_coding_agent
 
     instructions = load_prompt("coding_agent")
+    ttl = settings.response_cache_ttl_sec
+    cache_key = _response_cache_key(settings, instructions, prompt) if ttl > 0 else None
+    if cache_key is not None:
+        cached = _get_cached_response(cache_key, ttl)
+        if cached is not None:
+            return cached
+
     agent = cast(
         "SupportsAgentRun",
-        create_coding_agent(settings=settings, instructions=instructions),
+        create_coding_agent(
+            settings=settings,
+            instructions=instructions,
+        ),
     )
 
+    response = _run_agent(agent, prompt)
+    if cache_key is not None:
+        _store_cached_response(
+            cache_key,
+            response,
+            max_entries=settings.response_cache_max_entries,
+        )
+    return response
+
+
+async def arun_coding_agent_many(prompts: Sequence[str]) -> list[str]:
+    """Execute the coding agent for several prompts concurrently.
+
+    The agent is built once and at most
+    ``AgentSettings.max_concurrent_llm_calls`` requests run at a time.
+    Responses are returned in the order of ``prompts``.
+    """
+    from clean_interfaces.agents import create_coding_agent
+
+    settings = _require_configured_settings()
+
+    instructions = load_prompt("coding_agent")
+    agent = cast(
+        "SupportsAgentRun",
+        create_coding_agent(
+            settings=settings,
+            instructions=instructions,
+        ),
+    )
+    semaphore = asyncio.Semaphore(settings.max_concurrent_llm_calls)
+
+    async def run_one(prompt: str) -> str:
+        async with semaphore:
+            result = await agent.arun(prompt, stream=False)
+        return _coerce_response_to_string(result)
+
+    outcomes = await asyncio.gather(
+        *(run_one(prompt) for prompt in prompts),
+        return_exceptions=True,
+    )
+
+    responses: list[str] = []
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise AgentExecutionError(str(outcome)) from outcome
+        responses.append(outcome)
+    return responses
+
+
+def run_coding_agent_many(prompts: Sequence[str]) -> list[str]:
+    """Run :func:`arun_coding_agent_many` to completion synchronously."""
+    return asyncio.run(arun_coding_agent_many(prompts))
+
+
+def stream_coding_agent(prompt: str) -> Iterator[str]:
+    """Execute the agno coding agent and yield response text as it arrives.
+
+    Configuration errors are raised immediately; failures while generating the
+    response are raised as :class:`AgentExecutionError` during iteration.
+    """
+    from clean_interfaces.agents import create_coding_agent
+
+    settings = _require_configured_settings()
+
+    instructions = load_prompt("coding_agent")
+    agent = cast(
+        "SupportsAgentRun",
+        create_coding_agent(
+            settings=settings,
+            instructions=instructions,
+        ),
+    )
+    return _iter_response_chunks(agent, prompt)
+
+
+def _iter_response_chunks(agent: SupportsAgentRun, prompt: str) -> Iterator[str]:
+    """Yield the text deltas produced by a streaming agent run."""
     try:
-        result = agent.run(prompt)
+        for event in agent.run(prompt, stream=True):
+            chunk = _extract_stream_chunk(event)
+            if chunk:
+                yield chunk
     except Exception as exc:  # pragma: no cover - agno handles specifics internally
         raise AgentExecutionError(str(exc)) from exc
 
-    return _coerce_response_to_string(result)
+
+def _extract_stream_chunk(event: object) -> str | None:
+    """Return the text carried by a streamed agno event, if any."""
+    if isinstance(event, str):
+        return event
+    # Only content events carry deltas; completion events repeat the full text.
+    if getattr(event, "event", None) != "RunContent":
+        return None
+    content = getattr(event, "content", None)
+    return content if isinstance(content, str) else None
+
+
+def clear_response_cache() -> None:
+    """Drop every cached coding agent response."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def _response_cache_key(
+    settings: AgentSettings,
+    instructions: str,
+    prompt: str,
+) -> str:
+    """Return the cache key for a prompt under the given configuration."""
+    material = repr((settings_fingerprint(settings), instructions, prompt.strip()))
+    return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_response(key: str, ttl: float) -> str | None:
+    """Return a cached response if it has not expired."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > ttl:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return response
+
+
+def _store_cached_response(key: str, response: str, *, max_entries: int) -> None:
+    """Cache a response, evicting the least recently used entries."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), response)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > max_entries:
+            _response_cache.popitem(last=False)
 
 
 def run_repository_qa_agent(
@@ -81,9 +263,21 @@ def run_repository_qa_agent(
     project_path: Path | None = None,
 ) -> str:
     """Execute the repository QA agent and return its response text."""
-    settings = get_agent_settings()
-    if not settings.openai_api_key:
-        raise AgentConfigurationError
+    return _run_repository_qa_agent(
+        _require_configured_settings(),
+        prompt,
+        project_path=project_path,
+    )
+
+
+def _run_repository_qa_agent(
+    settings: AgentSettings,
+    prompt: str,
+    *,
+    project_path: Path | None = None,
+) -> str:
+    """Run the repository QA agent with already validated settings."""
+    from clean_interfaces.agents import create_repository_qa_agent
 
     instructions = load_prompt("repository_qa_agent")
     mcp_settings = get_mcp_settings()
@@ -97,12 +291,7 @@ def run_repository_qa_agent(
         ),
     )
 
-    try:
-        result = agent.run(prompt)
-    except Exception as exc:  # pragma: no cover - agno handles specifics internally
-        raise AgentExecutionError(str(exc)) from exc
-
-    return _coerce_response_to_string(result)
+    return _run_agent(agent, prompt)
 
 
 def run_serena_coder_agent(
@@ -111,9 +300,21 @@ def run_serena_coder_agent(
     project_path: Path | None = None,
 ) -> str:
     """Execute the Serena-backed coding agent and return its response text."""
-    settings = get_agent_settings()
-    if not settings.openai_api_key:
-        raise AgentConfigurationError
+    return _run_serena_coder_agent(
+        _require_configured_settings(),
+        prompt,
+        project_path=project_path,
+    )
+
+
+def _run_serena_coder_agent(
+    settings: AgentSettings,
+    prompt: str,
+    *,
+    project_path: Path | None = None,
+) -> str:
+    """Run the Serena coder agent with already validated settings."""
+    from clean_interfaces.agents import create_serena_coder_agent
 
     instructions = load_prompt("serena_coder_agent")
     mcp_settings = get_mcp_settings()
@@ -127,12 +328,7 @@ def run_serena_coder_agent(
         ),
     )
 
-    try:
-        result = agent.run(prompt)
-    except Exception as exc:  # pragma: no cover - agno handles specifics internally
-        raise AgentExecutionError(str(exc)) from exc
-
-    return _coerce_response_to_string(result)
+    return _run_agent(agent, prompt)
 
 
 def run_tdd_workflow(
@@ -142,11 +338,27 @@ def run_tdd_workflow(
     implementation_prompt: str,
     test_command: str,
     project_path: Path | None = None,
+    pipeline_tests: bool = False,
 ) -> WorkflowRunOutput:
     """Execute the end-to-end TDD workflow."""
-    settings = get_agent_settings()
-    if not settings.openai_api_key:
-        raise AgentConfigurationError
+    from clean_interfaces.agents import create_coding_agent
+    from clean_interfaces.workflow import create_tdd_workflow
+    from clean_interfaces.workflow.tdd import TDDWorkflowConfig
+
+    settings = _require_configured_settings()
+    coding_agent = cast(
+        "SupportsAgentRun",
+        create_coding_agent(
+            settings=settings,
+            instructions=load_prompt("coding_agent"),
+        ),
+    )
+
+    def _explore(prompt: str, path: Path | None) -> str:
+        return _run_serena_coder_agent(settings, prompt, project_path=path)
+
+    def _code(prompt: str) -> str:
+        return _run_agent(coding_agent, prompt)
 
     workflow = create_tdd_workflow(
         config=TDDWorkflowConfig(
@@ -155,31 +367,70 @@ def run_tdd_workflow(
             implementation_prompt=implementation_prompt,
             test_command=test_command,
             project_path=project_path,
+            pipeline_tests=pipeline_tests,
         ),
-        exploration_runner=lambda prompt, path: run_serena_coder_agent(
-            prompt,
-            project_path=path,
-        ),
-        test_writer_runner=run_coding_agent,
-        implementation_runner=run_coding_agent,
+        exploration_runner=_explore,
+        test_writer_runner=_code,
+        implementation_runner=_code,
     )
 
     return workflow.run()
 
 
+def _require_configured_settings() -> AgentSettings:
+    """Return the agent settings, ensuring an API key is configured."""
+    settings = get_agent_settings()
+    if not settings.openai_api_key:
+        raise AgentConfigurationError
+    return settings
+
+
+def _run_agent(agent: SupportsAgentRun, prompt: str) -> str:
+    """Run ``agent`` on ``prompt`` and return its response as text."""
+    try:
+        # Request the non-streaming path explicitly so agno skips stream setup.
+        result = agent.run(prompt, stream=False)
+    except Exception as exc:  # pragma: no cover - agno handles specifics internally
+        raise AgentExecutionError(str(exc)) from exc
+
+    return _coerce_response_to_string(result)
+
+
 def _coerce_response_to_string(result: SupportsStringContent | str | object) -> str:
     """Convert a variety of agno run outputs into plain text."""
-    if isinstance(result, str):
+    if type(result) is str:
         return result
 
-    if isinstance(result, SupportsStringContent):
-        return result.get_content_as_string()
+    result_type = type(result)
+    extractor = _response_extractors.get(result_type)
+    if extractor is None:
+        extractor = _build_response_extractor(result_type)
+        if extractor is not _extract_dynamic_content:
+            _response_extractors[result_type] = extractor
+    return extractor(result)
+
+
+def _build_response_extractor(result_type: type) -> Callable[[Any], str]:
+    """Return a text extractor specialised for instances of ``result_type``."""
+    get_content: Any = getattr(result_type, "get_content_as_string", None)
+    if not callable(get_content):
+        # Proxies and mocks may only expose the accessor per instance.
+        return _extract_dynamic_content
+
+    def extract(result: Any) -> str:
+        return _ensure_str(get_content(result))
+
+    return extract
+
+
+def _extract_dynamic_content(result: object) -> str:
+    """Extract text from an object by probing its instance attributes."""
+    get_content = getattr(result, "get_content_as_string", None)
+    if not callable(get_content):
+        return str(result)
+    return _ensure_str(get_content())
 
-    get_content: Any = getattr(result, "get_content_as_string", None)
-    if callable(get_content):
-        coerced = get_content()
-        if isinstance(coerced, str):
-            return coerced
-        return str(coerced)
 
-    return str(result)
+def _ensure_str(value: object) -> str:
+    """Return ``value`` unchanged if it is a ``str``, otherwise its ``str()``."""
+    return value if type(value) is str else str(value)
@@ -1,21 +1,19 @@
 """CLI interface implementation using Typer."""
 
+import copy
+import functools
+import operator
+import sys
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Concatenate
 
 import typer
-from rich.console import Console
-
-from clean_interfaces.core import (
-    AgentConfigurationError,
-    AgentExecutionError,
-    run_coding_agent,
-    run_repository_qa_agent,
-    run_serena_coder_agent,
-    run_tdd_workflow,
-)
+from rich.console import Console, Group, RenderableType
+from rich.rule import Rule
+from rich.text import Text
+
 from clean_interfaces.models.io import WelcomeMessage
-from clean_interfaces.workflow import TestCommandExecutionError
 
 from .base import BaseInterface
 
@@ -23,6 +21,84 @@ from .base import BaseInterface
 # Force terminal mode even in non-TTY environments
 console = Console(force_terminal=True, force_interactive=False)
 
+# The welcome message is static, so render its text once at import time.
+_WELCOME_MESSAGE = WelcomeMessage()
+_WELCOME_TEXT = f"{_WELCOME_MESSAGE.message}\n{_WELCOME_MESSAGE.hint}"
+
+_STEP_FIELDS = operator.attrgetter("step_name", "content")
+
+_MISSING_API_KEY_TEXT = Text(
+    "OpenAI API key not configured. Set the OPENAI_API_KEY environment variable.",
+    style="red",
+)
+
+
+def _sniff_subcommand(argv: Sequence[str], known: Iterable[str]) -> str | None:
+    """Return the subcommand named by the first CLI argument, if it is known.
+
+    Anything else, including options such as ``--help``, yields ``None`` so the
+    caller falls back to registering every command.
+    """
+    first = argv[1:2]
+    if not first or first[0].startswith("-"):
+        return None
+    return first[0] if first[0] in set(known) else None
+
+
+def _emit(text: str) -> None:
+    """Print agent output, writing plain text directly when not on a TTY."""
+    output = console.file
+    if output.isatty():
+        # Agent output is raw text; brackets in code must not be read as markup.
+        console.print(text, markup=False, highlight=False)
+    else:
+        # Skip Rich's markup and highlighting passes for piped output.
+        output.write(f"{text}\n")
+    output.flush()
+
+
+def _handle_agent_errors[**P](
+    failure_message: str,
+) -> Callable[
+    [Callable[Concatenate["CLIInterface", P], None]],
+    Callable[Concatenate["CLIInterface", P], None],
+]:
+    """Report agent and workflow failures from a command and exit with status 1."""
+
+    def decorator(
+        command: Callable[Concatenate["CLIInterface", P], None],
+    ) -> Callable[Concatenate["CLIInterface", P], None]:
+        @functools.wraps(command)
+        def wrapper(self: "CLIInterface", *args: P.args, **kwargs: P.kwargs) -> None:
+            from clean_interfaces.core import (
+                AgentConfigurationError,
+                AgentExecutionError,
+            )
+            from clean_interfaces.workflow.test_commands import (
+                TestCommandExecutionError,
+            )
+
+            try:
+                command(self, *args, **kwargs)
+            except AgentConfigurationError as exc:
+                console.print(_MISSING_API_KEY_TEXT)
+                self.logger.error("Agent configuration error", error=str(exc))
+                raise typer.Exit(1) from exc
+            except AgentExecutionError as exc:
+                self.logger.error("Agent execution failed", error=str(exc))
+                console.print(
+                    Text(f"{failure_message}: {exc}", style="red"),
+                )
+                raise typer.Exit(1) from exc
+            except TestCommandExecutionError as exc:
+                self.logger.error("Test command execution failed", error=str(exc))
+                console.print(Text(str(exc), style="red"))
+                raise typer.Exit(1) from exc
+
+        return wrapper
+
+    return decorator
+
 
 class CLIInterface(BaseInterface):
     """Command Line Interface implementation."""
@@ -49,12 +125,16 @@ class CLIInterface(BaseInterface):
 
     def _setup_commands(self) -> None:
         """Set up CLI commands."""
-        # Set the default command to welcome
-        self.app.command(name="welcome")(self.welcome)
-        self.app.command(name="agent")(self.agent)
-        self.app.command(name="repo-agent")(self.repo_agent)
-        self.app.command(name="serena-agent")(self.serena_agent)
-        self.app.command(name="tdd")(self.tdd)
+        commands = (
+            ("welcome", self.welcome),
+            ("agent", self.agent),
+            ("repo-agent", self.repo_agent),
+            ("serena-agent", self.serena_agent),
+            ("tdd", self.tdd),
+        )
+        register = self.app.command
+        for name, command in commands:
+            register(name=name)(command)
 
         # Add a callback that shows welcome when no command is specified
         self.app.callback(invoke_without_command=True)(self._main_callback)
@@ -68,13 +148,12 @@ class CLIInterface(BaseInterface):
 
     def welcome(self) -> None:
         """Display welcome message."""
-        msg = WelcomeMessage()
         # Use console for output (configured for E2E test compatibility)
-        console.print(msg.message)
-        console.print(msg.hint)
+        console.print(_WELCOME_TEXT)
         # Force flush to ensure output is visible
         console.file.flush()
 
+    @_handle_agent_errors("Failed to generate response")
     def agent(
         self,
         prompt: Annotated[
@@ -83,28 +162,18 @@ class CLIInterface(BaseInterface):
         ],
     ) -> None:
         """Generate a response using an agno-powered coding agent."""
+        from clean_interfaces.core import run_coding_agent
+
         self.logger.info(
             "Running agno agent",
             prompt=prompt,
         )
 
-        try:
-            response_text = run_coding_agent(prompt)
-        except AgentConfigurationError as exc:
-            console.print(
-                "[red]OpenAI API key not configured. "
-                "Set the OPENAI_API_KEY environment variable.[/red]",
-            )
-            self.logger.error("Agent configuration error", error=str(exc))
-            raise typer.Exit(1) from exc
-        except AgentExecutionError as exc:  # pragma: no cover - agno handles specifics
-            self.logger.error("Agent execution failed", error=str(exc))
-            console.print(f"[red]Failed to generate response: {exc}[/red]")
-            raise typer.Exit(1) from exc
-
-        console.print(response_text)
-        console.file.flush()
+        response_text = run_coding_agent(prompt)
 
+        _emit(response_text)
+
+    @_handle_agent_errors("Failed to generate response")
     def repo_agent(
         self,
         prompt: Annotated[
@@ -124,29 +193,26 @@ class CLIInterface(BaseInterface):
         ] = None,
     ) -> None:
         """Generate a response using the repository QA agent."""
+        from clean_interfaces.core import run_repository_qa_agent
+
+        # Typer has already checked the directory exists; resolve it once so that
+        # downstream agent and toolkit caches see one canonical path.
+        project_path = project_path.resolve() if project_path else None
+        project_path_str = str(project_path) if project_path else None
         self.logger.info(
             "Running repository QA agent",
             prompt=prompt,
-            project_path=str(project_path) if project_path else None,
+            project_path=project_path_str,
         )
 
-        try:
-            response_text = run_repository_qa_agent(prompt, project_path=project_path)
-        except AgentConfigurationError as exc:
-            console.print(
-                "[red]OpenAI API key not configured. "
-                "Set the OPENAI_API_KEY environment variable.[/red]",
-            )
-            self.logger.error("Agent configuration error", error=str(exc))
-            raise typer.Exit(1) from exc
-        except AgentExecutionError as exc:  # pragma: no cover - agno handles specifics
-            self.logger.error("Agent execution failed", error=str(exc))
-            console.print(f"[red]Failed to generate response: {exc}[/red]")
-            raise typer.Exit(1) from exc
-
-        console.print(response_text)
-        console.file.flush()
+        response_text = run_repository_qa_agent(
+            prompt,
+            project_path=project_path,
+        )
 
+        _emit(response_text)
+
+    @_handle_agent_errors("Failed to generate response")
     def serena_agent(
         self,
         prompt: Annotated[
@@ -166,29 +232,24 @@ class CLIInterface(BaseInterface):
         ] = None,
     ) -> None:
         """Generate a response using the Serena-powered coding agent."""
+        from clean_interfaces.core import run_serena_coder_agent
+
+        project_path = project_path.resolve() if project_path else None
+        project_path_str = str(project_path) if project_path else None
         self.logger.info(
             "Running Serena coding agent",
             prompt=prompt,
-            project_path=str(project_path) if project_path else None,
+            project_path=project_path_str,
         )
 
-        try:
-            response_text = run_serena_coder_agent(prompt, project_path=project_path)
-        except AgentConfigurationError as exc:
-            console.print(
-                "[red]OpenAI API key not configured. "
-                "Set the OPENAI_API_KEY environment variable.[/red]",
-            )
-            self.logger.error("Agent configuration error", error=str(exc))
-            raise typer.Exit(1) from exc
-        except AgentExecutionError as exc:  # pragma: no cover - agno handles specifics
-            self.logger.error("Agent execution failed", error=str(exc))
-            console.print(f"[red]Failed to generate response: {exc}[/red]")
-            raise typer.Exit(1) from exc
-
-        console.print(response_text)
-        console.file.flush()
+        response_text = run_serena_coder_agent(
+            prompt,
+            project_path=project_path,
+        )
+
+        _emit(response_text)
 
+    @_handle_agent_errors("Failed to run workflow")
     def tdd(
         self,
         exploration_prompt: Annotated[
@@ -225,66 +286,97 @@ class CLIInterface(BaseInterface):
                 help="Optional project directory for the workflow to operate in.",
             ),
         ] = None,
+        *,
+        pipeline: Annotated[
+            bool,
+            typer.Option(
+                "--pipeline",
+                help=(
+                    "Run the test command as a pipeline, feeding each stage's"
+                    " output to the next. Separate stages with ' | '."
+                ),
+            ),
+        ] = False,
     ) -> None:
         """Run the agentic TDD workflow."""
+        from clean_interfaces.core import run_tdd_workflow
+
+        project_path = project_path.resolve() if project_path else None
+        project_path_str = str(project_path) if project_path else None
         self.logger.info(
             "Running TDD workflow",
             exploration_prompt=exploration_prompt,
             test_prompt=test_prompt,
             implementation_prompt=implementation_prompt,
             test_command=test_command,
-            project_path=str(project_path) if project_path else None,
+            project_path=project_path_str,
+            pipeline=pipeline,
         )
 
-        try:
-            workflow_run = run_tdd_workflow(
-                exploration_prompt=exploration_prompt,
-                test_prompt=test_prompt,
-                implementation_prompt=implementation_prompt,
-                test_command=test_command,
-                project_path=project_path,
-            )
-        except AgentConfigurationError as exc:
-            console.print(
-                "[red]OpenAI API key not configured. "
-                "Set the OPENAI_API_KEY environment variable.[/red]",
-            )
-            self.logger.error("Agent configuration error", error=str(exc))
-            raise typer.Exit(1) from exc
-        except AgentExecutionError as exc:
-            self.logger.error("Agent execution failed", error=str(exc))
-            console.print(f"[red]Failed to run workflow: {exc}[/red]")
-            raise typer.Exit(1) from exc
-        except TestCommandExecutionError as exc:
-            self.logger.error("Test command execution failed", error=str(exc))
-            console.print(f"[red]{exc}[/red]")
-            raise typer.Exit(1) from exc
-
-        step_results = list(workflow_run.step_results or [])
-        for step in step_results:
-            step_name = getattr(step, "step_name", None) or "Workflow step"
-            console.rule(step_name)
-            content = getattr(step, "content", None)
-            if isinstance(content, str):
-                console.print(content)
-            elif content is not None:
-                console.print(str(content))
+        workflow_run = run_tdd_workflow(
+            exploration_prompt=exploration_prompt,
+            test_prompt=test_prompt,
+            implementation_prompt=implementation_prompt,
+            test_command=test_command,
+            project_path=project_path,
+            pipeline_tests=pipeline,
+        )
+
+        # Collect every step into one renderable so the terminal receives a
+        # single write instead of one per rule and step.
+        renderables: list[RenderableType] = []
+        had_steps = False
+        last_content: object = None
+        for step in workflow_run.step_results or ():
+            had_steps = True
+            try:
+                step_name, last_content = _STEP_FIELDS(step)
+            except AttributeError:
+                step_name = getattr(step, "step_name", None)
+                last_content = getattr(step, "content", None)
+            renderables.append(Rule(step_name or "Workflow step"))
+            if isinstance(last_content, str):
+                renderables.append(last_content)
+            elif last_content is not None:
+                renderables.append(str(last_content))
 
         final_content = workflow_run.content
         if isinstance(final_content, str):
-            last_content = (
-                getattr(step_results[-1], "content", None) if step_results else None
-            )
-            if not step_results or final_content != last_content:
-                console.rule("Workflow summary")
-                console.print(final_content)
-        elif final_content is not None and not step_results:
-            console.rule("Workflow summary")
-            console.print(str(final_content))
+            if not had_steps or final_content != last_content:
+                renderables.extend((Rule("Workflow summary"), final_content))
+        elif final_content is not None and not had_steps:
+            renderables.extend((Rule("Workflow summary"), str(final_content)))
 
+        if renderables:
+            console.print(Group(*renderables))
         console.file.flush()
 
     def run(self) -> None:
         """Run the CLI interface."""
+        # The welcome screen takes no arguments, so skip Typer's parsing for it.
+        if sys.argv[1:] in ([], ["welcome"]):
+            self.welcome()
+            return
+
         # Let Typer handle the command parsing
-        self.app()
+        self._app_for(sys.argv)()
+
+    def _app_for(self, argv: Sequence[str]) -> typer.Typer:
+        """Return an app limited to the command named by ``argv``, if any.
+
+        Only the invoked command needs Typer's parameter introspection. The
+        trimmed app is a shallow copy, so ``self.app`` keeps every command.
+        """
+        registered = self.app.registered_commands
+        requested = _sniff_subcommand(
+            argv,
+            (command.name for command in registered if command.name),
+        )
+        if requested is None:
+            return self.app
+
+        app = copy.copy(self.app)
+        app.registered_commands = [
+            command for command in registered if command.name == requested
+        ]
+        return app
@@ -6,6 +6,10 @@ from clean_interfaces.models.io import WelcomeMessage
 
 from .base import BaseInterface
 
+# The welcome message is static, so render its text once at import time.
+_WELCOME_MESSAGE = WelcomeMessage()
+_WELCOME_TEXT = f"{_WELCOME_MESSAGE.message}\n{_WELCOME_MESSAGE.hint}"
+
 
 class MCPInterface(BaseInterface):
     """MCP Interface implementation."""
@@ -32,8 +36,7 @@ class MCPInterface(BaseInterface):
         @self.mcp.tool()
         def welcome() -> str:  # pyright: ignore [reportUnusedFunction]
             """Display welcome message."""
-            msg = WelcomeMessage()
-            return f"{msg.message}\n{msg.hint}"
+            return _WELCOME_TEXT
 
     def run(self) -> None:
         """Run the MCP interface."""
@@ -2,7 +2,7 @@
 
 This package exposes a factory to create provider-specific model instances.
 """
-from .factory import create_model, LLMProviderNotAvailableError
+from .factory import clear_model_cache, create_model, LLMProviderNotAvailableError
 
-__all__ = ["LLMProviderNotAvailableError", "create_model"]
+__all__ = ["LLMProviderNotAvailableError", "clear_model_cache", "create_model"]
 
@@ -15,11 +15,18 @@ Notes:
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
+import functools
+import importlib
 import logging
+import sys
+import threading
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:  # pragma: no cover - types only
+    from collections.abc import Callable
+
     from clean_interfaces.utils.settings import AgentSettings
 
 
@@ -27,6 +34,63 @@ class LLMProviderNotAvailableError(RuntimeError):
     """Raised when the requested provider integration is not available."""
 
 
+_AZURE_CHAT_MODULES = ("agno.models.azure_openai", "agno.models.azure")
+_ANTHROPIC_MODULES = ("agno.models.anthropic",)
+_GEMINI_MODULES = ("agno.models.gemini", "agno.models.google")
+
+_AZURE_REQUIRED = (
+    ("azure_openai_api_key", "AZURE_OPENAI_API_KEY"),
+    ("azure_openai_endpoint", "AZURE_OPENAI_ENDPOINT"),
+    ("azure_openai_api_version", "AZURE_OPENAI_API_VERSION"),
+    ("azure_openai_deployment", "AZURE_OPENAI_DEPLOYMENT"),
+)
+
+
+@functools.cache
+def _resolve_model_class(paths: tuple[str, ...], class_name: str) -> Any | None:
+    """Return ``class_name`` from the first importable module in ``paths``.
+
+    The result (including a miss) is cached so repeat model construction does
+    not probe the candidate modules again.
+    """
+    for path in paths:
+        try:
+            module = sys.modules.get(path) or importlib.import_module(path)
+            return getattr(module, class_name)
+        except Exception as exc:  # pragma: no cover - optional integration
+            logger.debug("%s import failed from %s: %s", class_name, path, exc)
+            continue
+    return None
+
+
+def _require_model_class(
+    paths: tuple[str, ...],
+    class_name: str,
+    integration: str,
+) -> Any:
+    """Return the resolved model class or raise if the integration is missing."""
+    model_class = _resolve_model_class(paths, class_name)
+    if model_class is None:  # pragma: no cover - optional integration
+        msg = (
+            f"{integration} integration is not available in agno. "
+            f"Install a version that provides {class_name}."
+        )
+        raise LLMProviderNotAvailableError(msg)
+    return model_class
+
+
+def _model_kwargs(settings: AgentSettings, prefix: str) -> dict[str, Any]:
+    """Return model id, API key and optional base URL for a provider prefix."""
+    kwargs: dict[str, Any] = {
+        "id": getattr(settings, f"{prefix}_model"),
+        "api_key": getattr(settings, f"{prefix}_api_key"),
+    }
+    base_url = getattr(settings, f"{prefix}_base_url", None)
+    if base_url:
+        kwargs["base_url"] = base_url
+    return kwargs
+
+
 def _build_openai_model(settings: AgentSettings) -> Any:
     """Construct an OpenAI Responses model using OpenAI credentials.
 
@@ -40,13 +104,7 @@ def _build_openai_model(settings: AgentSettings) -> Any:
         msg = "OpenAI Responses integration is not available in agno."
         raise LLMProviderNotAvailableError(msg) from exc
 
-    kwargs: dict[str, Any] = {
-        "id": settings.openai_model,
-        "api_key": settings.openai_api_key,
-    }
-    if getattr(settings, "openai_base_url", None):
-        kwargs["base_url"] = settings.openai_base_url  # type: ignore[assignment]
-    return OpenAIResponses(**kwargs)
+    return OpenAIResponses(**_model_kwargs(settings, "openai"))
 
 
 def _build_azure_openai_model(settings: AgentSettings) -> Any:
@@ -54,35 +112,17 @@ def _build_azure_openai_model(settings: AgentSettings) -> Any:
 
     Uses legacy Chat class as Azure Responses model is not available in agno.
     """
-    model_class: Any | None = None
-    for path in (
-        "agno.models.azure_openai",
-        "agno.models.azure",
-    ):
-        try:
-            module = __import__(path, fromlist=["AzureOpenAIChat"])  # type: ignore[assignment]
-            model_class = module.AzureOpenAIChat
-            break
-        except Exception as exc:  # pragma: no cover - optional integration
-            logger.debug("AzureOpenAIChat import failed from %s: %s", path, exc)
-            continue
-
-    if model_class is None:  # pragma: no cover - optional integration
-        msg = (
-            "Azure OpenAI integration is not available in agno. "
-            "Install a version that provides AzureOpenAIChat."
-        )
-        raise LLMProviderNotAvailableError(msg)
+    model_class = _require_model_class(
+        _AZURE_CHAT_MODULES,
+        "AzureOpenAIChat",
+        "Azure OpenAI",
+    )
 
-    missing: list[str] = []
-    if not getattr(settings, "azure_openai_api_key", None):
-        missing.append("AZURE_OPENAI_API_KEY")
-    if not getattr(settings, "azure_openai_endpoint", None):
-        missing.append("AZURE_OPENAI_ENDPOINT")
-    if not getattr(settings, "azure_openai_api_version", None):
-        missing.append("AZURE_OPENAI_API_VERSION")
-    if not getattr(settings, "azure_openai_deployment", None):
-        missing.append("AZURE_OPENAI_DEPLOYMENT")
+    missing = [
+        env_name
+        for field, env_name in _AZURE_REQUIRED
+        if not getattr(settings, field, None)
+    ]
     if missing:  # pragma: no cover - validated upstream usually
         joined = ", ".join(missing)
         msg = "Missing Azure OpenAI settings: " + joined
@@ -98,70 +138,65 @@ def _build_azure_openai_model(settings: AgentSettings) -> Any:
 
 def _build_anthropic_model(settings: AgentSettings) -> Any:
     """Construct an Anthropic model instance."""
-    model_class: Any | None = None
-    for path in (
-        "agno.models.anthropic",
-    ):
-        try:
-            module = __import__(path, fromlist=["AnthropicChat"])  # type: ignore[assignment]
-            model_class = module.AnthropicChat
-            break
-        except Exception as exc:  # pragma: no cover - optional integration
-            logger.debug("AnthropicChat import failed from %s: %s", path, exc)
-            continue
-
-    if model_class is None:  # pragma: no cover - optional integration
-        msg = (
-            "Anthropic integration is not available in agno. "
-            "Install a version that provides AnthropicChat."
-        )
-        raise LLMProviderNotAvailableError(msg)
+    model_class = _require_model_class(_ANTHROPIC_MODULES, "AnthropicChat", "Anthropic")
 
-    kwargs: dict[str, Any] = {
-        "id": settings.anthropic_model,
-        "api_key": settings.anthropic_api_key,
-    }
-    if getattr(settings, "anthropic_base_url", None):
-        kwargs["base_url"] = settings.anthropic_base_url  # type: ignore[assignment]
-    return model_class(**kwargs)
+    return model_class(**_model_kwargs(settings, "anthropic"))
 
 
 def _build_gemini_model(settings: AgentSettings) -> Any:
     """Construct a Google Gemini model instance."""
-    model_class: Any | None = None
-    for path in (
-        "agno.models.gemini",
-        "agno.models.google",
-    ):
-        try:
-            module = __import__(path, fromlist=["GeminiChat"])  # type: ignore[assignment]
-            model_class = module.GeminiChat
-            break
-        except Exception as exc:  # pragma: no cover - optional integration
-            logger.debug("GeminiChat import failed from %s: %s", path, exc)
-            continue
+    model_class = _require_model_class(_GEMINI_MODULES, "GeminiChat", "Gemini")
 
-    if model_class is None:  # pragma: no cover - optional integration
-        msg = (
-            "Gemini integration is not available in agno. "
-            "Install a version that provides GeminiChat."
-        )
-        raise LLMProviderNotAvailableError(msg)
+    return model_class(**_model_kwargs(settings, "gemini"))
 
-    kwargs: dict[str, Any] = {
-        "id": settings.gemini_model,
-        "api_key": settings.gemini_api_key,
-    }
-    if getattr(settings, "gemini_base_url", None):
-        kwargs["base_url"] = settings.gemini_base_url  # type: ignore[assignment]
-    return model_class(**kwargs)
+
+_PROVIDER_BUILDERS: dict[str, Callable[[AgentSettings], Any]] = {
+    "openai": _build_openai_model,
+    "azure_openai": _build_azure_openai_model,
+    "anthropic": _build_anthropic_model,
+    "gemini": _build_gemini_model,
+}
+
+_PROVIDER_FINGERPRINT_FIELDS: dict[str, tuple[str, ...]] = {
+    "openai": ("openai_model", "openai_api_key", "openai_base_url"),
+    "azure_openai": (
+        "azure_openai_endpoint",
+        "azure_openai_api_key",
+        "azure_openai_api_version",
+        "azure_openai_deployment",
+    ),
+    "anthropic": ("anthropic_model", "anthropic_api_key", "anthropic_base_url"),
+    "gemini": ("gemini_model", "gemini_api_key", "gemini_base_url"),
+}
+
+_MAX_CACHED_MODELS = 8
+
+_models: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+_models_lock = threading.Lock()
 
 
-def create_model(settings: AgentSettings) -> Any:
+def _model_fingerprint(provider: str, settings: AgentSettings) -> tuple[Any, ...]:
+    """Return the provider-relevant settings that determine the built model."""
+    fields = _PROVIDER_FINGERPRINT_FIELDS[provider]
+    return (provider, *(getattr(settings, field, None) for field in fields))
+
+
+def clear_model_cache() -> None:
+    """Drop every memoised model instance."""
+    with _models_lock:
+        _models.clear()
+
+
+def create_model(settings: AgentSettings, *, use_cache: bool = True) -> Any:
     """Create a provider-specific agno model instance.
 
+    Models are memoised per provider, model id, credentials and endpoint, so
+    identical settings share one client. Pass ``use_cache=False`` when a
+    distinct instance is required.
+
     Args:
         settings: The agent settings containing provider and credentials.
+        use_cache: Whether to reuse a model built for identical settings.
 
     Returns:
         A model instance compatible with ``agno.agent.Agent``.
@@ -172,14 +207,25 @@ def create_model(settings: AgentSettings) -> Any:
 
     """
     provider = getattr(settings, "provider", "openai")
-    if provider == "openai":
-        return _build_openai_model(settings)
-    if provider == "azure_openai":
-        return _build_azure_openai_model(settings)
-    if provider == "anthropic":
-        return _build_anthropic_model(settings)
-    if provider == "gemini":
-        return _build_gemini_model(settings)
-    msg = "Unsupported LLM provider: " + str(provider)
-    raise ValueError(msg)
-
+    try:
+        builder = _PROVIDER_BUILDERS[provider]
+    except KeyError:
+        msg = "Unsupported LLM provider: " + str(provider)
+        raise ValueError(msg) from None
+    if not use_cache:
+        return builder(settings)
+
+    key = _model_fingerprint(provider, settings)
+    with _models_lock:
+        if key in _models:
+            _models.move_to_end(key)
+            return _models[key]
+
+    model = builder(settings)
+
+    with _models_lock:
+        _models[key] = model
+        _models.move_to_end(key)
+        while len(_models) > _MAX_CACHED_MODELS:
+            _models.popitem(last=False)
+    return model
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class BaseLSPWalker(ABC):
     """Abstract base class for LSP-oriented MCP walkers."""
 
+    __slots__ = ("_project_path",)
+
     def __init__(self, *, project_path: Path | None = None) -> None:
         """Store the optional project path to explore."""
         self._project_path = project_path.resolve() if project_path else None
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import sys
 from typing import TYPE_CHECKING
 
-from .serena import SerenaLSPWalker
-
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from clean_interfaces.utils.settings import MCPSettings
 
     from .base import BaseLSPWalker
 
+_PROVIDERS: dict[str, tuple[str, str]] = {
+    "serena": ("clean_interfaces.mcp.serena", "SerenaLSPWalker"),
+}
+
+
+@functools.cache
+def _resolve_walker_class(provider: str) -> Callable[..., BaseLSPWalker]:
+    """Import and return the walker class registered for ``provider``."""
+    module_name, class_name = _PROVIDERS[provider]
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, class_name)
+
 
 def create_lsp_walker(
     settings: MCPSettings,
@@ -20,10 +34,11 @@ def create_lsp_walker(
     project_path: Path | None = None,
 ) -> BaseLSPWalker:
     """Create an LSP walker implementation based on configuration."""
-    provider = settings.lsp_walker_provider.lower()
+    provider = settings.lsp_walker_provider
 
-    if provider == "serena":
-        return SerenaLSPWalker(settings=settings, project_path=project_path)
+    if provider not in _PROVIDERS:
+        msg = f"Unsupported LSP walker provider: {provider}"
+        raise ValueError(msg)
 
-    msg = f"Unsupported LSP walker provider: {settings.lsp_walker_provider}"
-    raise ValueError(msg)
+    walker_class = _resolve_walker_class(provider)
+    return walker_class(settings=settings, project_path=project_path)
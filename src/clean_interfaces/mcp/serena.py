@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
+import functools
 import shlex
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from agno.tools.mcp import MCPTools
-
 from .base import BaseLSPWalker
 
 if TYPE_CHECKING:
+    from agno.tools.mcp import MCPTools
+
     from clean_interfaces.utils.settings import MCPSettings
 
 
+@functools.lru_cache(maxsize=128)
+def _compose_command(
+    base_command: str,
+    context: str | None,
+    project_path: str,
+) -> str:
+    """Return ``base_command`` with context and project flags appended once."""
+    parts = shlex.split(base_command)
+    present_flags = {part.partition("=")[0] for part in parts}
+
+    if context and "--context" not in present_flags:
+        parts.extend(["--context", context])
+
+    if "--project" not in present_flags:
+        parts.extend(["--project", project_path])
+
+    return shlex.join(parts)
+
+
 class SerenaLSPWalker(BaseLSPWalker):
     """LSP walker that launches the Serena MCP server."""
 
+    __slots__ = ("_base_kwargs", "_command", "_needs_command", "_settings")
+
     def __init__(
         self,
         settings: MCPSettings,
@@ -26,11 +48,14 @@ class SerenaLSPWalker(BaseLSPWalker):
         """Initialise the Serena walker with configuration and project path."""
         super().__init__(project_path=project_path)
         self._settings = settings
-
-    def _has_flag(self, parts: list[str], flag: str) -> bool:
-        """Return whether the command parts already include a given flag."""
-        flag_prefix = f"{flag}="
-        return any(part == flag or part.startswith(flag_prefix) for part in parts)
+        self._base_kwargs: dict[str, Any] = {
+            "transport": settings.lsp_walker_transport,
+            "timeout_seconds": settings.lsp_walker_timeout_seconds,
+        }
+        if settings.lsp_walker_url:
+            self._base_kwargs["url"] = settings.lsp_walker_url
+        self._needs_command = settings.lsp_walker_transport == "stdio"
+        self._command = self._build_command()
 
     def _resolve_project_path(self) -> Path:
         """Resolve the project path to use when launching the server."""
@@ -43,33 +68,21 @@ class SerenaLSPWalker(BaseLSPWalker):
         if not base_command:
             return None
 
-        parts = shlex.split(base_command)
-
-        if self._settings.lsp_walker_context and not self._has_flag(parts, "--context"):
-            parts.extend(["--context", self._settings.lsp_walker_context])
-
-        project_path = self._resolve_project_path()
-        if not self._has_flag(parts, "--project"):
-            parts.extend(["--project", str(project_path)])
-
-        return shlex.join(parts)
+        return _compose_command(
+            base_command,
+            self._settings.lsp_walker_context,
+            str(self._resolve_project_path()),
+        )
 
     def create_toolkit(self) -> MCPTools:
         """Return a configured MCP toolkit for the Serena walker."""
-        command = self._build_command()
-        kwargs: dict[str, Any] = {
-            "transport": self._settings.lsp_walker_transport,
-            "timeout_seconds": self._settings.lsp_walker_timeout_seconds,
-        }
-
-        if self._settings.lsp_walker_url:
-            kwargs["url"] = self._settings.lsp_walker_url
-
-        if command:
-            kwargs["command"] = command
+        from agno.tools.mcp import MCPTools
 
-        if self._settings.lsp_walker_transport == "stdio" and not command:
-            msg = "Serena LSP walker requires a command when using stdio transport"
-            raise ValueError(msg)
+        command = self._command
+        if not command:
+            if self._needs_command:
+                msg = "Serena LSP walker requires a command when using stdio transport"
+                raise ValueError(msg)
+            return MCPTools(**self._base_kwargs)
 
-        return MCPTools(**kwargs)
+        return MCPTools(**self._base_kwargs, command=command)
@@ -1,6 +1,5 @@
 """Prompt utilities for Clean Interfaces agents."""
 
-from .loader import load_prompt
-
-__all__ = ["load_prompt"]
+from .loader import clear_prompt_cache, load_prompt
 
+__all__ = ["clear_prompt_cache", "load_prompt"]
@@ -1,24 +1,53 @@
 """Utilities for loading bundled agent prompts."""
 
+import functools
 from importlib import resources
+from importlib.resources.abc import Traversable
 from pathlib import Path
 
 from clean_interfaces.utils.file_handler import FileHandler
 
 
 def load_prompt(name: str, *, file_handler: FileHandler | None = None) -> str:
-    """Load a prompt template bundled with the package."""
-    handler = file_handler or FileHandler()
+    """Load a prompt template bundled with the package.
+
+    Bundled prompts are immutable, so their contents are cached per name. A
+    custom ``file_handler`` bypasses the cache and is always consulted.
+    """
+    if file_handler is None:
+        return _read_bundled_prompt(name)
+    return _read_prompt(name, file_handler)
+
+
+def clear_prompt_cache() -> None:
+    """Forget prompt contents cached by :func:`load_prompt`."""
+    _read_bundled_prompt.cache_clear()
+
+
+@functools.cache
+def _read_bundled_prompt(name: str) -> str:
+    """Read a bundled prompt once per process."""
+    return _prompt_resource(name).read_text(encoding="utf-8")
+
+
+def _read_prompt(name: str, handler: FileHandler) -> str:
+    """Read the named prompt resource through ``handler``."""
+    resource = _prompt_resource(name)
+    if isinstance(resource, Path):
+        return handler.read_text(resource)
+
+    with resources.as_file(resource) as resolved_path:
+        return handler.read_text(Path(resolved_path))
+
+
+def _prompt_resource(name: str) -> Traversable:
+    """Return the packaged resource for ``name`` or raise if it is missing."""
     resource = resources.files(__package__).joinpath(f"{name}.md")
 
     if not resource.is_file():
         message = f"Prompt '{name}' was not found."
         raise FileNotFoundError(message)
+    return resource
 
-    with resources.as_file(resource) as resolved_path:
-        path = Path(resolved_path)
-        return handler.read_text(path)
-
-
-__all__ = ["load_prompt"]
 
+__all__ = ["clear_prompt_cache", "load_prompt"]
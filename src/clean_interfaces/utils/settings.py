@@ -4,12 +4,16 @@ This module provides centralized configuration management for the application,
 with support for environment variables and validation.
 """
 
+import functools
+import os
 from enum import Enum
-from typing import Any, ClassVar, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import Field, field_validator
+from pydantic import BeforeValidator, Field, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from clean_interfaces.types import InterfaceType
+
 
 class OTelExportMode(str, Enum):
     """OpenTelemetry log export modes."""
@@ -19,28 +23,48 @@ class OTelExportMode(str, Enum):
     BOTH = "both"
 
 
-class LoggingSettings(BaseSettings):
-    """Logging configuration settings.
+def _upper(value: Any) -> Any:
+    """Upper-case string input so choices are matched case-insensitively."""
+    return value.upper() if isinstance(value, str) else value
 
-    All settings can be configured via environment variables.
-    """
 
-    instance: ClassVar[Any] = None
+def _lower(value: Any) -> Any:
+    """Lower-case string input so choices are matched case-insensitively."""
+    return value.lower() if isinstance(value, str) else value
+
+
+LogLevel = Annotated[
+    Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    BeforeValidator(_upper),
+]
+LogFormat = Annotated[Literal["json", "console", "plain"], BeforeValidator(_lower)]
+
+
+class _AppSettings(BaseSettings):
+    """Shared configuration for every settings model in the application."""
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
+
+class LoggingSettings(_AppSettings):
+    """Logging configuration settings.
+
+    All settings can be configured via environment variables.
+    """
+
     # Basic logging settings
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+    log_level: LogLevel = Field(
         default="INFO",
         description="Logging level",
     )
 
-    log_format: Literal["json", "console", "plain"] = Field(
+    log_format: LogFormat = Field(
         default="json",
         description="Log output format",
     )
@@ -72,59 +96,16 @@ class LoggingSettings(BaseSettings):
         ge=1,
     )
 
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level value."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v.upper() not in valid_levels:
-            msg = f"Invalid log level: {v}. Must be one of {valid_levels}"
-            raise ValueError(msg)
-        return v.upper()
-
-    @field_validator("log_format")
-    @classmethod
-    def validate_log_format(cls, v: str) -> str:
-        """Validate log format value."""
-        valid_formats = {"json", "console", "plain"}
-        if v.lower() not in valid_formats:
-            msg = f"Invalid log format: {v}. Must be one of {valid_formats}"
-            raise ValueError(msg)
-        return v.lower()
-
-    @field_validator("otel_export_timeout")
-    @classmethod
-    def validate_timeout(cls, v: int) -> int:
-        """Validate timeout is positive."""
-        if v <= 0:
-            msg = "Timeout must be a positive integer"
-            raise ValueError(msg)
-        return v
-
-    @property
+    @computed_field  # type: ignore[prop-decorator]
+    @functools.cached_property
     def otel_export_enabled(self) -> bool:
         """Check if OpenTelemetry export is enabled."""
         return self.otel_logs_export_mode in (OTelExportMode.OTLP, OTelExportMode.BOTH)
 
-    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
-        """Dump model including computed properties."""
-        data = super().model_dump(**kwargs)
-        data["otel_export_enabled"] = self.otel_export_enabled
-        return data
 
-
-class InterfaceSettings(BaseSettings):
+class InterfaceSettings(_AppSettings):
     """Interface configuration settings."""
 
-    instance: ClassVar[Any] = None
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     interface_type: str = Field(
         default="cli",
         description="Type of interface to use (cli, restapi)",
@@ -134,8 +115,6 @@ class InterfaceSettings(BaseSettings):
     @classmethod
     def validate_interface_type(cls, v: str) -> str:
         """Validate interface type value."""
-        from clean_interfaces.types import InterfaceType
-
         try:
             # Validate that it's a valid interface type
             InterfaceType(v.lower())
@@ -145,26 +124,16 @@ class InterfaceSettings(BaseSettings):
             msg = f"Invalid interface type: {v}. Must be one of {valid_types}"
             raise ValueError(msg) from None
 
-    @property
-    def interface_type_enum(self) -> Any:
+    @functools.cached_property
+    def interface_type_enum(self) -> InterfaceType:
         """Get interface type as enum."""
-        from clean_interfaces.types import InterfaceType
-
         return InterfaceType(self.interface_type)
 
 
-class AgentSettings(BaseSettings):
+class AgentSettings(_AppSettings):
     """Configuration settings for agent integrations."""
 
-    instance: ClassVar[Any] = None
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="AGNO_",
-    )
+    model_config = SettingsConfigDict(env_prefix="AGNO_")
 
     # Provider selection
     provider: Literal["openai", "azure_openai", "anthropic", "gemini"] = Field(
@@ -247,20 +216,30 @@ class AgentSettings(BaseSettings):
         default="Clean Interfaces Agent",
         description="Display name assigned to agno agents.",
     )
+    response_cache_ttl_sec: float = Field(
+        default=0,
+        description=(
+            "Seconds to reuse responses for identical coding agent prompts. "
+            "0 disables the cache; only enable it for deterministic models."
+        ),
+        ge=0,
+    )
+    response_cache_max_entries: int = Field(
+        default=256,
+        description="Maximum number of cached coding agent responses.",
+        ge=1,
+    )
+    max_concurrent_llm_calls: int = Field(
+        default=8,
+        description="Upper bound on concurrent agent requests in batched runs.",
+        ge=1,
+    )
 
 
-class MCPSettings(BaseSettings):
+class MCPSettings(_AppSettings):
     """Configuration for MCP integrations used by agents."""
 
-    instance: ClassVar[Any] = None
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="MCP_",
-    )
+    model_config = SettingsConfigDict(env_prefix="MCP_")
 
     lsp_walker_provider: Literal["serena"] = Field(
         default="serena",
@@ -291,6 +270,7 @@ class MCPSettings(BaseSettings):
     )
 
 
+@functools.cache
 def get_settings() -> LoggingSettings:
     """Get the global settings instance.
 
@@ -298,9 +278,7 @@ def get_settings() -> LoggingSettings:
         LoggingSettings: The settings instance
 
     """
-    if LoggingSettings.instance is None:
-        LoggingSettings.instance = LoggingSettings()
-    return LoggingSettings.instance
+    return LoggingSettings()
 
 
 def reset_settings() -> None:
@@ -308,9 +286,10 @@ def reset_settings() -> None:
 
     This is mainly useful for testing.
     """
-    LoggingSettings.instance = None
+    get_settings.cache_clear()
 
 
+@functools.cache
 def get_interface_settings() -> InterfaceSettings:
     """Get the global interface settings instance.
 
@@ -318,9 +297,7 @@ def get_interface_settings() -> InterfaceSettings:
         InterfaceSettings: The interface settings instance
 
     """
-    if InterfaceSettings.instance is None:
-        InterfaceSettings.instance = InterfaceSettings()
-    return InterfaceSettings.instance
+    return InterfaceSettings()
 
 
 def reset_interface_settings() -> None:
@@ -328,28 +305,37 @@ def reset_interface_settings() -> None:
 
     This is mainly useful for testing.
     """
-    InterfaceSettings.instance = None
+    get_interface_settings.cache_clear()
 
 
+@functools.cache
 def get_agent_settings() -> AgentSettings:
     """Get the global agent settings instance."""
-    if AgentSettings.instance is None:
-        AgentSettings.instance = AgentSettings()
-    return AgentSettings.instance
+    return AgentSettings()
 
 
 def reset_agent_settings() -> None:
     """Reset the global agent settings instance."""
-    AgentSettings.instance = None
+    get_agent_settings.cache_clear()
 
 
+@functools.cache
 def get_mcp_settings() -> MCPSettings:
     """Get the global MCP settings instance."""
-    if MCPSettings.instance is None:
-        MCPSettings.instance = MCPSettings()
-    return MCPSettings.instance
+    return MCPSettings()
 
 
 def reset_mcp_settings() -> None:
     """Reset the global MCP settings instance."""
-    MCPSettings.instance = None
+    get_mcp_settings.cache_clear()
+
+
+_EAGER_SETTINGS_ENV = "CLEAN_INTERFACES_EAGER_SETTINGS"
+
+if os.environ.get(_EAGER_SETTINGS_ENV, "").lower() in {"1", "true", "yes"}:
+    # Read .env and the environment once at import time instead of on the
+    # first request; the reset_* helpers still force a fresh read.
+    get_settings()
+    get_interface_settings()
+    get_agent_settings()
+    get_mcp_settings()
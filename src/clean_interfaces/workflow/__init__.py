@@ -1,17 +1,43 @@
-"""Workflow orchestration utilities for Clean Interfaces."""
-
-from .tdd import create_tdd_workflow
-from .test_commands import (
-    TestCommandExecutionError,
-    TestCommandExecutor,
-    TestCommandManager,
-    TestCommandResult,
-    WorkflowCommandConfig,
-    create_manager_from_config,
-    load_workflow_command_config,
-)
+"""Workflow orchestration utilities for Clean Interfaces.
+
+Public names are resolved lazily on first attribute access so that importing
+the package does not pull in ``agno.workflow`` or the subprocess helpers.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tdd import TDDWorkflowConfig, create_tdd_workflow
+    from .test_commands import (
+        TestCommandExecutionError,
+        TestCommandExecutor,
+        TestCommandManager,
+        TestCommandResult,
+        WorkflowCommandConfig,
+        create_manager_from_config,
+        load_workflow_command_config,
+    )
+
+_TDD = "clean_interfaces.workflow.tdd"
+_TEST_COMMANDS = "clean_interfaces.workflow.test_commands"
+
+_LAZY: dict[str, str] = {
+    "TDDWorkflowConfig": _TDD,
+    "TestCommandExecutionError": _TEST_COMMANDS,
+    "TestCommandExecutor": _TEST_COMMANDS,
+    "TestCommandManager": _TEST_COMMANDS,
+    "TestCommandResult": _TEST_COMMANDS,
+    "WorkflowCommandConfig": _TEST_COMMANDS,
+    "create_manager_from_config": _TEST_COMMANDS,
+    "create_tdd_workflow": _TDD,
+    "load_workflow_command_config": _TEST_COMMANDS,
+}
 
 __all__ = [
+    "TDDWorkflowConfig",
     "TestCommandExecutionError",
     "TestCommandExecutor",
     "TestCommandManager",
@@ -21,3 +47,21 @@ __all__ = [
     "create_tdd_workflow",
     "load_workflow_command_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested workflow helper on first access and cache it."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved helpers in ``dir()`` output."""
+    return sorted({*globals(), *_LAZY})
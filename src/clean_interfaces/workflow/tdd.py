@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+import functools
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from agno.workflow import Step, StepInput, Workflow
-
 from .test_commands import TestCommandExecutor, TestCommandManager, TestCommandResult
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from agno.workflow import StepInput, Workflow
+
 
 @dataclass(slots=True)
 class TDDWorkflowConfig:
@@ -23,8 +25,13 @@ class TDDWorkflowConfig:
     implementation_prompt: str
     test_command: str
     project_path: Path | None = None
+    pipeline_tests: bool = False
 
 
+# Only the latest result feeds later prompts; older runs are dropped so a
+# long-lived workflow does not retain every historical test output.
+_MAX_RETAINED_TEST_RESULTS = 8
+
 ExplorationRunner = Callable[[str, "Path | None"], str]
 CodingRunner = Callable[[str], str]
 
@@ -38,7 +45,7 @@ class _TDDStepFactory:
     exploration_runner: ExplorationRunner
     test_writer_runner: CodingRunner
     implementation_runner: CodingRunner
-    test_results: list[TestCommandResult]
+    test_results: deque[TestCommandResult]
 
     exploration_step_name: str = "Explore codebase"
     test_step_name: str = "Design tests"
@@ -56,16 +63,13 @@ class _TDDStepFactory:
     def write_tests(self, step_input: StepInput) -> Any:
         """Run the test authoring agent with exploration context."""
         exploration_output = step_input.get_step_content(self.exploration_step_name)
-        prompt = self._append_context(
-            self.config.test_prompt,
-            "Context from exploration:",
-            exploration_output,
-        )
-        return self.test_writer_runner(prompt)
+        parts = [self.config.test_prompt]
+        self._append_context(parts, "Context from exploration:", exploration_output)
+        return self.test_writer_runner("\n\n".join(parts))
 
     def initial_test_run(self, _step_input: StepInput) -> Any:
         """Execute the first test run and capture its summary."""
-        result = self.executor.run(self.config.test_command)
+        result = self._run_tests()
         self.test_results.append(result)
         return self._format_test_summary(result, expect_success=False)
 
@@ -75,38 +79,41 @@ class _TDDStepFactory:
         tests_output = step_input.get_step_content(self.test_step_name)
         previous_result = self.test_results[-1] if self.test_results else None
 
-        prompt = self._append_context(
-            self.config.implementation_prompt,
-            "Context from exploration:",
-            exploration_output,
-        )
-        prompt = self._append_context(prompt, "Tests to satisfy:", tests_output)
+        parts = [self.config.implementation_prompt]
+        self._append_context(parts, "Context from exploration:", exploration_output)
+        self._append_context(parts, "Tests to satisfy:", tests_output)
         if previous_result:
-            prompt = self._append_context(
-                prompt,
+            self._append_context(
+                parts,
                 "Latest test run (expected failure):",
                 previous_result.to_prompt_block(),
             )
-        return self.implementation_runner(prompt)
+        return self.implementation_runner("\n\n".join(parts))
 
     def final_test_run(self, _step_input: StepInput) -> Any:
         """Execute the final test run to confirm success."""
-        result = self.executor.run(self.config.test_command)
+        result = self._run_tests()
         self.test_results.append(result)
         return self._format_test_summary(result, expect_success=True)
 
+    def _run_tests(self) -> TestCommandResult:
+        """Run the configured test command, piping its stages when requested."""
+        if self.config.pipeline_tests:
+            return self.executor.run_pipeline(self.config.test_command)
+        return self.executor.run(self.config.test_command)
+
+    @staticmethod
     def _append_context(
-        self,
-        prompt: str,
+        parts: list[str],
         heading: str,
         content: object | None,
-    ) -> str:
+    ) -> None:
+        """Append a headed context block to ``parts`` when content is present."""
         if not content:
-            return prompt
+            return
         content_str = str(content).strip()
-        if not content_str:
-            return prompt
-        return f"{prompt}\n\n{heading}\n{content_str}"
+        if content_str:
+            parts.append(f"{heading}\n{content_str}")
 
     @staticmethod
     def _format_test_summary(
@@ -125,6 +132,12 @@ class _TDDStepFactory:
         return f"{result.format()}\n\n{status_line}"
 
 
+@functools.cache
+def _default_command_manager() -> TestCommandManager:
+    """Return the shared manager holding only the built-in command aliases."""
+    return TestCommandManager()
+
+
 def create_tdd_workflow(
     *,
     config: TDDWorkflowConfig,
@@ -134,7 +147,9 @@ def create_tdd_workflow(
     implementation_runner: CodingRunner | None = None,
 ) -> Workflow:
     """Create a workflow that automates a TDD development session."""
-    manager = command_manager or TestCommandManager()
+    from agno.workflow import Step, Workflow
+
+    manager = command_manager or _default_command_manager()
     executor = TestCommandExecutor(manager, cwd=config.project_path)
     factory = _TDDStepFactory(
         config=config,
@@ -142,19 +157,20 @@ def create_tdd_workflow(
         exploration_runner=exploration_runner,
         test_writer_runner=test_writer_runner,
         implementation_runner=implementation_runner or test_writer_runner,
-        test_results=[],
-    )
-
-    steps: Sequence[Step] = (
-        Step(name=factory.exploration_step_name, executor=factory.exploration),
-        Step(name=factory.test_step_name, executor=factory.write_tests),
-        Step(name=factory.initial_test_run_name, executor=factory.initial_test_run),
-        Step(name=factory.implementation_step_name, executor=factory.implement_feature),
-        Step(name=factory.final_test_run_name, executor=factory.final_test_run),
+        test_results=deque(maxlen=_MAX_RETAINED_TEST_RESULTS),
     )
 
     return Workflow(
         name="TDD Workflow",
         description="Run exploration, tests, and implementation in a TDD loop.",
-        steps=list(steps),
+        steps=[
+            Step(name=factory.exploration_step_name, executor=factory.exploration),
+            Step(name=factory.test_step_name, executor=factory.write_tests),
+            Step(name=factory.initial_test_run_name, executor=factory.initial_test_run),
+            Step(
+                name=factory.implementation_step_name,
+                executor=factory.implement_feature,
+            ),
+            Step(name=factory.final_test_run_name, executor=factory.final_test_run),
+        ],
     )
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import shlex
 import subprocess
+import threading
 import time
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal, cast
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Any, Literal, cast
 
 from clean_interfaces.base import BaseComponent
 from clean_interfaces.utils.file_handler import FileHandler
@@ -48,6 +50,18 @@ class TestCommandResult:
     stdout: str
     stderr: str
     duration: float
+    _sections: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Strip the captured output once and keep its non-empty sections."""
+        stdout = self.stdout.strip()
+        stderr = self.stderr.strip()
+        sections: list[str] = []
+        if stdout:
+            sections.append("Stdout:\n" + stdout)
+        if stderr:
+            sections.append("Stderr:\n" + stderr)
+        self._sections = tuple(sections)
 
     @property
     def succeeded(self) -> bool:
@@ -64,11 +78,8 @@ class TestCommandResult:
             f"Command: {self.command_display()}",
             f"Exit code: {self.returncode}",
             f"Duration: {self.duration:.2f}s",
+            *self._sections,
         ]
-        if self.stdout.strip():
-            lines.append("Stdout:\n" + self.stdout.strip())
-        if self.stderr.strip():
-            lines.append("Stderr:\n" + self.stderr.strip())
         return "\n".join(lines)
 
     def to_prompt_block(self) -> str:
@@ -76,13 +87,8 @@ class TestCommandResult:
         summary = [
             f"Command: {self.command_display()}",
             f"Exit code: {self.returncode}",
+            *self._sections,
         ]
-        stdout = self.stdout.strip()
-        stderr = self.stderr.strip()
-        if stdout:
-            summary.append("Stdout:\n" + stdout)
-        if stderr:
-            summary.append("Stderr:\n" + stderr)
         return "\n".join(summary)
 
 
@@ -222,6 +228,125 @@ class TestCommandExecutor(BaseComponent):
         results = [self._execute(command, timeout=timeout) for command in commands]
         return tuple(results)
 
+    async def run_all_concurrent(
+        self,
+        command_spec: str,
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109 - per-command, like run_all
+    ) -> tuple[TestCommandResult, ...]:
+        """Execute all commands associated with the specification concurrently.
+
+        Every command runs to completion (or its own ``timeout``) before the
+        first failure, if any, is raised.
+        """
+        commands = self._manager.resolve_all(command_spec)
+        outcomes = await asyncio.gather(
+            *(self._execute_async(command, timeout=timeout) for command in commands),
+            return_exceptions=True,
+        )
+        results: list[TestCommandResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return tuple(results)
+
+    def run_pipeline(
+        self,
+        command_spec: str,
+        *,
+        timeout: float | None = None,
+    ) -> TestCommandResult:
+        """Execute the specification's commands as one shell-style pipeline.
+
+        Stages come from an alias registered with several commands, or from
+        bare ``|`` tokens in a command string such as
+        ``"git ls-files | xargs pytest"``; both forms may be combined. Each
+        stage's stdout feeds the next stage's stdin, so later stages start
+        while earlier ones are still producing output. The combined
+        result reports the last stage's stdout, every stage's stderr, and the
+        rightmost non-zero exit code (``pipefail`` semantics). ``timeout``
+        bounds the whole pipeline rather than each stage.
+        """
+        commands = _pipeline_stages(self._manager.resolve_all(command_spec))
+        pipeline = _pipeline_command(commands)
+        self.logger.info(
+            "Running test pipeline",
+            command=pipeline,
+            cwd=str(self._cwd) if self._cwd else None,
+            timeout=timeout,
+        )
+
+        start = time.perf_counter()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        processes: list[subprocess.Popen[str]] = []
+        upstream: IO[str] | None = None
+        try:
+            for command in commands:
+                process = subprocess.Popen(  # noqa: S603 - executed without shell, aliases are validated
+                    command,
+                    cwd=self._cwd,
+                    env=self._env,
+                    stdin=upstream,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+                if upstream is not None:
+                    # Only the child holds the read end now, so SIGPIPE reaches
+                    # the producer if a later stage exits early.
+                    upstream.close()
+                upstream = process.stdout
+                processes.append(process)
+        except OSError as exc:  # pragma: no cover - environment-specific
+            _kill_all(processes)
+            raise TestCommandExecutionError(pipeline, str(exc)) from exc
+
+        stderr_buffers: list[list[str]] = [[] for _ in processes]
+        readers = [
+            threading.Thread(
+                target=_drain,
+                args=(cast("IO[str]", process.stderr), buffer),
+                daemon=True,
+            )
+            for process, buffer in zip(processes[:-1], stderr_buffers, strict=False)
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            stdout, last_stderr = processes[-1].communicate(
+                timeout=_remaining(deadline),
+            )
+            for process in processes[:-1]:
+                process.wait(timeout=_remaining(deadline))
+        except subprocess.TimeoutExpired as exc:  # pragma: no cover - rare in tests
+            _kill_all(processes)
+            raise TestCommandExecutionError(
+                pipeline,
+                "Test command timed out",
+            ) from exc
+        finally:
+            for reader in readers:
+                reader.join()
+
+        stderr_buffers[-1].append(last_stderr)
+        returncode = next(
+            (
+                process.returncode
+                for process in reversed(processes)
+                if process.returncode
+            ),
+            0,
+        )
+        return self._finish(
+            pipeline,
+            returncode=returncode,
+            stdout=stdout,
+            stderr="".join(chunk for buffer in stderr_buffers for chunk in buffer),
+            start=start,
+        )
+
     def _execute(
         self,
         command: tuple[str, ...],
@@ -259,13 +384,74 @@ class TestCommandExecutor(BaseComponent):
         except OSError as exc:  # pragma: no cover - environment-specific
             raise TestCommandExecutionError(command, str(exc)) from exc
 
-        duration = time.perf_counter() - start
-        result = TestCommandResult(
-            command=command,
+        return self._finish(
+            command,
             returncode=completed.returncode,
             stdout=completed.stdout,
             stderr=completed.stderr,
-            duration=duration,
+            start=start,
+        )
+
+    async def _execute_async(
+        self,
+        command: tuple[str, ...],
+        *,
+        timeout: float | None,  # noqa: ASYNC109 - the child is killed on expiry
+    ) -> TestCommandResult:
+        """Execute a single command sequence without blocking the event loop."""
+        self.logger.info(
+            "Running test command",
+            command=command,
+            cwd=str(self._cwd) if self._cwd else None,
+            timeout=timeout,
+        )
+
+        start = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=self._cwd,
+                env=self._env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as exc:  # pragma: no cover - environment-specific
+            raise TestCommandExecutionError(command, str(exc)) from exc
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(),
+                timeout=timeout,
+            )
+        except TimeoutError as exc:  # pragma: no cover - rare in tests
+            process.kill()
+            await process.wait()
+            raise TestCommandExecutionError(command, "Test command timed out") from exc
+
+        return self._finish(
+            command,
+            returncode=process.returncode if process.returncode is not None else -1,
+            stdout=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+            start=start,
+        )
+
+    def _finish(
+        self,
+        command: tuple[str, ...],
+        *,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        start: float,
+    ) -> TestCommandResult:
+        """Build the result for a completed command and log its outcome."""
+        result = TestCommandResult(
+            command=command,
+            returncode=returncode,
+            stdout=stdout,
+            stderr=stderr,
+            duration=time.perf_counter() - start,
         )
 
         self.logger.info(
@@ -277,6 +463,53 @@ class TestCommandExecutor(BaseComponent):
         return result
 
 
+def _pipeline_stages(commands: CommandSequence) -> CommandSequence:
+    """Split each command on bare ``|`` tokens into separate pipeline stages."""
+    stages: list[tuple[str, ...]] = []
+    for command in commands:
+        stage: list[str] = []
+        for part in (*command, "|"):
+            if part != "|":
+                stage.append(part)
+                continue
+            if not stage:
+                message = "Pipeline stages cannot be empty"
+                raise ValueError(message)
+            stages.append(tuple(stage))
+            stage = []
+    return tuple(stages)
+
+
+def _pipeline_command(commands: CommandSequence) -> tuple[str, ...]:
+    """Flatten pipeline stages into one command tuple separated by ``|``."""
+    parts: list[str] = []
+    for command in commands:
+        if parts:
+            parts.append("|")
+        parts.extend(command)
+    return tuple(parts)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Return the seconds left before ``deadline``, or ``None`` if unbounded."""
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def _drain(stream: IO[str], sink: list[str]) -> None:
+    """Read ``stream`` to EOF into ``sink`` so the writer never blocks."""
+    with stream:
+        sink.append(stream.read())
+
+
+def _kill_all(processes: Iterable[subprocess.Popen[str]]) -> None:
+    """Kill and reap every process in a partially started pipeline."""
+    for process in processes:
+        process.kill()
+        process.wait()
+
+
 @dataclass(slots=True)
 class WorkflowCommandConfig:
     """Command configuration for agent workflows."""
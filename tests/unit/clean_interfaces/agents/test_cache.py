@@ -0,0 +1,102 @@
+"""Tests for the agent instance cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+from clean_interfaces.agents.cache import (
+    clear_agent_cache,
+    close_all_walkers,
+    get_or_create_agent,
+    get_or_create_toolkit,
+)
+from clean_interfaces.agents.coding import create_coding_agent
+from clean_interfaces.utils.settings import AgentSettings, MCPSettings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_get_or_create_agent_reuses_instances() -> None:
+    """The factory should only run once per cache key until the cache is cleared."""
+    clear_agent_cache()
+    factory = MagicMock(side_effect=[object(), object()])
+
+    first = get_or_create_agent(("test", 1), factory)
+    second = get_or_create_agent(("test", 1), factory)
+
+    assert first is second
+    assert factory.call_count == 1
+
+    clear_agent_cache()
+    third = get_or_create_agent(("test", 1), factory)
+
+    assert third is not first
+    assert factory.call_count == 2
+    clear_agent_cache()
+
+
+def test_create_coding_agent_is_memoised_per_configuration() -> None:
+    """Identical settings and instructions should share one agent instance."""
+    clear_agent_cache()
+    settings = AgentSettings.model_validate({"OPENAI_API_KEY": "sk-test"})
+    sentinel = object()
+
+    with patch(
+        "clean_interfaces.agents.coding._build_coding_agent",
+        return_value=sentinel,
+    ) as mock_build:
+        first = create_coding_agent(settings=settings, instructions="Be helpful")
+        second = create_coding_agent(settings=settings, instructions="Be helpful")
+        create_coding_agent(settings=settings, instructions="Be terse")
+
+    assert first is sentinel
+    assert second is sentinel
+    assert mock_build.call_count == 2
+    clear_agent_cache()
+
+
+def test_get_or_create_toolkit_shares_walkers_until_closed(tmp_path: Path) -> None:
+    """One walker should back every toolkit request for the same configuration."""
+    mcp_settings = MCPSettings()
+    walker = MagicMock()
+    walker_factory = MagicMock(return_value=walker)
+
+    first = get_or_create_toolkit(mcp_settings, tmp_path, walker_factory)
+    second = get_or_create_toolkit(mcp_settings, tmp_path, walker_factory)
+
+    assert first is second
+    walker_factory.assert_called_once()
+    walker.create_toolkit.assert_called_once()
+
+    close_all_walkers()
+
+    walker.create_toolkit.return_value.close.assert_called_once()
+    get_or_create_toolkit(mcp_settings, tmp_path, walker_factory)
+    assert walker_factory.call_count == 2
+    close_all_walkers()
+
+
+def test_get_or_create_toolkit_keys_default_project_on_cwd(
+    tmp_path: Path,
+    monkeypatch: Any,
+) -> None:
+    """Walkers without a project path should not be shared across directories."""
+    mcp_settings = MCPSettings()
+    walker_factory = MagicMock(side_effect=MagicMock)
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    monkeypatch.chdir(first_dir)
+    first = get_or_create_toolkit(mcp_settings, None, walker_factory)
+    assert get_or_create_toolkit(mcp_settings, first_dir, walker_factory) is first
+
+    monkeypatch.chdir(second_dir)
+    second = get_or_create_toolkit(mcp_settings, None, walker_factory)
+
+    assert second is not first
+    assert walker_factory.call_count == 2
+    close_all_walkers()
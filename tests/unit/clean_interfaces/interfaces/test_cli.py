@@ -1,5 +1,6 @@
 """Tests for CLI interface implementation."""
 
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,6 +10,7 @@ import typer
 from clean_interfaces.core import AgentConfigurationError
 from clean_interfaces.interfaces.base import BaseInterface
 from clean_interfaces.interfaces.cli import CLIInterface
+from clean_interfaces.workflow import test_commands
 
 
 class TestCLIInterface:
@@ -37,14 +39,11 @@ class TestCLIInterface:
         with patch("clean_interfaces.interfaces.cli.console") as mock_console:
             cli.welcome()
 
-            # Check that welcome message was printed (should be called twice)
-            assert mock_console.print.call_count == 2
-            # First call is the welcome message
-            first_call = mock_console.print.call_args_list[0][0]
-            assert "Welcome to Clean Interfaces!" in str(first_call)
-            # Second call is the hint
-            second_call = mock_console.print.call_args_list[1][0]
-            assert "Type --help for more information" in str(second_call)
+            # The message and hint are printed together in a single call
+            mock_console.print.assert_called_once()
+            printed = str(mock_console.print.call_args[0])
+            assert "Welcome to Clean Interfaces!" in printed
+            assert "Type --help for more information" in printed
 
     def test_cli_run_method(self) -> None:
         """Test CLI run method executes typer app."""
@@ -53,10 +52,25 @@ class TestCLIInterface:
         # Mock the typer app
         cli.app = MagicMock()
 
-        cli.run()
+        with patch.object(sys, "argv", ["clean-interfaces", "agent", "hello"]):
+            cli.run()
 
         cli.app.assert_called_once()
 
+    def test_cli_run_shows_welcome_without_typer(self) -> None:
+        """Running without arguments should print the welcome text directly."""
+        cli = CLIInterface()
+        cli.app = MagicMock()
+
+        with (
+            patch.object(sys, "argv", ["clean-interfaces"]),
+            patch("clean_interfaces.interfaces.cli.console") as mock_console,
+        ):
+            cli.run()
+
+        cli.app.assert_not_called()
+        mock_console.print.assert_called_once()
+
     def test_cli_agent_requires_api_key(self) -> None:
         """The agent command should exit when the API key is missing."""
         cli = CLIInterface()
@@ -64,7 +78,7 @@ class TestCLIInterface:
         with (
             patch("clean_interfaces.interfaces.cli.console") as mock_console,
             patch(
-                "clean_interfaces.interfaces.cli.run_coding_agent",
+                "clean_interfaces.core.run_coding_agent",
             ) as mock_run,
         ):
             mock_run.side_effect = AgentConfigurationError("missing key")
@@ -80,7 +94,7 @@ class TestCLIInterface:
 
         with (
             patch("clean_interfaces.interfaces.cli.console") as mock_console,
-            patch("clean_interfaces.interfaces.cli.run_coding_agent") as mock_run,
+            patch("clean_interfaces.core.run_coding_agent") as mock_run,
         ):
             mock_run.return_value = "Agent response"
 
@@ -89,7 +103,29 @@ class TestCLIInterface:
             cli.agent("Write code")
 
             mock_run.assert_called_once_with("Write code")
-            mock_console.print.assert_any_call("Agent response")
+            mock_console.print.assert_any_call(
+                "Agent response",
+                markup=False,
+                highlight=False,
+            )
+            mock_console.file.flush.assert_called_once()
+
+    def test_cli_agent_writes_plain_text_when_piped(self) -> None:
+        """Agent output should bypass Rich rendering when stdout is not a TTY."""
+        cli = CLIInterface()
+
+        with (
+            patch("clean_interfaces.interfaces.cli.console") as mock_console,
+            patch("clean_interfaces.core.run_coding_agent") as mock_run,
+        ):
+            mock_run.return_value = "Agent [b]response[/b]"
+            mock_console.file = MagicMock()
+            mock_console.file.isatty.return_value = False
+
+            cli.agent("Write code")
+
+            mock_console.print.assert_not_called()
+            mock_console.file.write.assert_called_once_with("Agent [b]response[/b]\n")
             mock_console.file.flush.assert_called_once()
 
     def test_cli_repo_agent_requires_api_key(self) -> None:
@@ -99,7 +135,7 @@ class TestCLIInterface:
         with (
             patch("clean_interfaces.interfaces.cli.console") as mock_console,
             patch(
-                "clean_interfaces.interfaces.cli.run_repository_qa_agent",
+                "clean_interfaces.core.run_repository_qa_agent",
             ) as mock_run,
         ):
             mock_run.side_effect = AgentConfigurationError("missing key")
@@ -116,7 +152,7 @@ class TestCLIInterface:
         with (
             patch("clean_interfaces.interfaces.cli.console") as mock_console,
             patch(
-                "clean_interfaces.interfaces.cli.run_repository_qa_agent",
+                "clean_interfaces.core.run_repository_qa_agent",
             ) as mock_run,
         ):
             mock_run.return_value = "QA response"
@@ -129,7 +165,11 @@ class TestCLIInterface:
                 "Where is the config?",
                 project_path=tmp_path,
             )
-            mock_console.print.assert_any_call("QA response")
+            mock_console.print.assert_any_call(
+                "QA response",
+                markup=False,
+                highlight=False,
+            )
             mock_console.file.flush.assert_called_once()
 
     def test_cli_serena_agent_requires_api_key(self) -> None:
@@ -139,7 +179,7 @@ class TestCLIInterface:
         with (
             patch("clean_interfaces.interfaces.cli.console") as mock_console,
             patch(
-                "clean_interfaces.interfaces.cli.run_serena_coder_agent",
+                "clean_interfaces.core.run_serena_coder_agent",
             ) as mock_run,
         ):
             mock_run.side_effect = AgentConfigurationError("missing key")
@@ -156,7 +196,7 @@ class TestCLIInterface:
         with (
             patch("clean_interfaces.interfaces.cli.console") as mock_console,
             patch(
-                "clean_interfaces.interfaces.cli.run_serena_coder_agent",
+                "clean_interfaces.core.run_serena_coder_agent",
             ) as mock_run,
         ):
             mock_run.return_value = "Serena response"
@@ -169,5 +209,81 @@ class TestCLIInterface:
                 "Implement feature",
                 project_path=tmp_path,
             )
-            mock_console.print.assert_any_call("Serena response")
+            mock_console.print.assert_any_call(
+                "Serena response",
+                markup=False,
+                highlight=False,
+            )
             mock_console.file.flush.assert_called_once()
+
+    def test_cli_tdd_reports_test_command_failures(self) -> None:
+        """The tdd command should exit cleanly when a test command fails."""
+        cli = CLIInterface()
+
+        with (
+            patch("clean_interfaces.interfaces.cli.console") as mock_console,
+            patch("clean_interfaces.core.run_tdd_workflow") as mock_run,
+        ):
+            mock_run.side_effect = test_commands.TestCommandExecutionError(
+                ("pytest",),
+                "Tests failed",
+            )
+
+            with pytest.raises(typer.Exit):
+                cli.tdd("explore", "write tests", "implement")
+
+            mock_console.print.assert_called_once()
+            assert "Tests failed" in mock_console.print.call_args[0][0]
+
+    def test_cli_tdd_passes_pipeline_flag(self) -> None:
+        """The --pipeline option should reach the TDD workflow runner."""
+        cli = CLIInterface()
+
+        with (
+            patch("clean_interfaces.interfaces.cli.console"),
+            patch("clean_interfaces.core.run_tdd_workflow") as mock_run,
+        ):
+            mock_run.return_value.step_results = []
+            mock_run.return_value.content = None
+            cli.tdd("explore", "write tests", "implement", pipeline=True)
+
+        assert mock_run.call_args.kwargs["pipeline_tests"] is True
+
+    def test_cli_registers_all_commands_regardless_of_argv(self) -> None:
+        """Construction should always register the full command table."""
+        with patch.object(sys, "argv", ["clean-interfaces", "agent", "hello"]):
+            cli = CLIInterface()
+
+        names = {command.name for command in cli.app.registered_commands}
+        assert names == {"welcome", "agent", "repo-agent", "serena-agent", "tdd"}
+
+    def test_cli_run_keeps_only_the_invoked_command(self) -> None:
+        """Running a known subcommand should invoke an app with only that command."""
+        cli = CLIInterface()
+        all_names = {command.name for command in cli.app.registered_commands}
+
+        with (
+            patch.object(sys, "argv", ["clean-interfaces", "agent", "hello"]),
+            patch.object(typer.Typer, "__call__", autospec=True) as mock_call,
+        ):
+            cli.run()
+
+        mock_call.assert_called_once()
+        invoked_app = mock_call.call_args.args[0]
+        assert [command.name for command in invoked_app.registered_commands] == [
+            "agent",
+        ]
+        assert {command.name for command in cli.app.registered_commands} == all_names
+
+    def test_cli_run_keeps_all_commands_for_options(self) -> None:
+        """Options such as --help should keep every command registered."""
+        cli = CLIInterface()
+
+        with (
+            patch.object(sys, "argv", ["clean-interfaces", "--help"]),
+            patch.object(typer.Typer, "__call__"),
+        ):
+            cli.run()
+
+        names = {command.name for command in cli.app.registered_commands}
+        assert names == {"welcome", "agent", "repo-agent", "serena-agent", "tdd"}
@@ -0,0 +1,49 @@
+"""Tests for the LLM provider factory."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from clean_interfaces.llm import clear_model_cache, create_model
+from clean_interfaces.utils.settings import AgentSettings
+
+
+def _anthropic_settings(api_key: str = "sk-ant") -> AgentSettings:
+    return AgentSettings.model_validate(
+        {"provider": "anthropic", "ANTHROPIC_API_KEY": api_key},
+    )
+
+
+def test_create_model_memoises_per_provider_fingerprint() -> None:
+    """Identical provider settings should share one model instance."""
+    clear_model_cache()
+
+    def _build(**_: object) -> object:
+        return object()
+
+    model_class = MagicMock(side_effect=_build)
+
+    with patch(
+        "clean_interfaces.llm.factory._resolve_model_class",
+        return_value=model_class,
+    ):
+        first = create_model(_anthropic_settings())
+        second = create_model(_anthropic_settings())
+        other = create_model(_anthropic_settings(api_key="sk-other"))
+        uncached = create_model(_anthropic_settings(), use_cache=False)
+
+    assert first is second
+    assert other is not first
+    assert uncached is not first
+    assert model_class.call_count == 3
+    clear_model_cache()
+
+
+def test_create_model_rejects_unknown_provider() -> None:
+    """Unsupported providers should raise ``ValueError``."""
+    settings = AgentSettings.model_construct(provider="unknown")
+
+    with pytest.raises(ValueError, match="Unsupported LLM provider: unknown"):
+        create_model(settings)
@@ -18,9 +18,8 @@ def test_factory_returns_serena_walker() -> None:
 
 def test_factory_rejects_unknown_provider() -> None:
     """Factory should raise on unsupported providers."""
-    settings = MCPSettings(lsp_walker_provider="serena")
-    # type ignore to circumvent Literal check during instantiation for test
-    settings.lsp_walker_provider = "unknown"  # type: ignore[assignment]
+    # model_construct skips the Literal check so an unknown provider can be used
+    settings = MCPSettings.model_construct(lsp_walker_provider="unknown")  # type: ignore[arg-type]
 
     with pytest.raises(ValueError, match="Unsupported LSP walker provider"):
         create_lsp_walker(settings)
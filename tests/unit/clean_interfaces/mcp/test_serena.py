@@ -5,9 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import agno.tools.mcp as agno_mcp
 import pytest
 
-import clean_interfaces.mcp.serena as serena_module
 from clean_interfaces.mcp.serena import SerenaLSPWalker
 from clean_interfaces.utils.settings import MCPSettings
 
@@ -37,7 +37,7 @@ def test_serena_walker_appends_context_and_project(
         captured.update(kwargs)
         return DummyMCPTools(**kwargs)
 
-    monkeypatch.setattr(serena_module, "MCPTools", fake_mcp_tools)
+    monkeypatch.setattr(agno_mcp, "MCPTools", fake_mcp_tools)
 
     walker = SerenaLSPWalker(settings=settings, project_path=tmp_path)
     toolkit = walker.create_toolkit()
@@ -60,7 +60,7 @@ def test_serena_requires_command_for_stdio(monkeypatch: pytest.MonkeyPatch) -> N
         lsp_walker_transport="stdio",
     )
 
-    monkeypatch.setattr(serena_module, "MCPTools", DummyMCPTools)
+    monkeypatch.setattr(agno_mcp, "MCPTools", DummyMCPTools)
 
     walker = SerenaLSPWalker(settings=settings)
 
@@ -81,7 +81,7 @@ def test_serena_defaults_project_to_cwd(monkeypatch: pytest.MonkeyPatch) -> None
         captured.update(kwargs)
         return DummyMCPTools(**kwargs)
 
-    monkeypatch.setattr(serena_module, "MCPTools", fake_mcp_tools)
+    monkeypatch.setattr(agno_mcp, "MCPTools", fake_mcp_tools)
 
     walker = SerenaLSPWalker(settings=settings)
     walker.create_toolkit()
@@ -107,7 +107,7 @@ def test_serena_does_not_duplicate_flags(monkeypatch: pytest.MonkeyPatch) -> Non
         captured.update(kwargs)
         return DummyMCPTools(**kwargs)
 
-    monkeypatch.setattr(serena_module, "MCPTools", fake_mcp_tools)
+    monkeypatch.setattr(agno_mcp, "MCPTools", fake_mcp_tools)
 
     walker = SerenaLSPWalker(settings=settings)
     walker.create_toolkit()
@@ -115,3 +115,25 @@ def test_serena_does_not_duplicate_flags(monkeypatch: pytest.MonkeyPatch) -> Non
     command_parts = captured["command"].split()
     assert command_parts.count("--context") == 1
     assert command_parts.count("--project") == 1
+
+
+def test_serena_recognises_inline_flag_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Flags written as ``--flag=value`` should also count as present."""
+    settings = MCPSettings(
+        lsp_walker_command=(
+            "uvx serena start-mcp-server --context=custom --project=/tmp/repo"
+        ),
+        lsp_walker_context="ignored",
+    )
+
+    monkeypatch.setattr(agno_mcp, "MCPTools", DummyMCPTools)
+
+    walker = SerenaLSPWalker(settings=settings)
+    toolkit = walker.create_toolkit()
+
+    assert isinstance(toolkit, DummyMCPTools)
+    assert toolkit.kwargs["command"] == (
+        "uvx serena start-mcp-server --context=custom --project=/tmp/repo"
+    )
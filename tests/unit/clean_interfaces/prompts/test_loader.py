@@ -1,10 +1,11 @@
 """Tests for the prompt loading utilities."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from clean_interfaces.prompts.loader import load_prompt
+from clean_interfaces.prompts.loader import clear_prompt_cache, load_prompt
 from clean_interfaces.utils.file_handler import FileHandler
 
 
@@ -49,3 +50,19 @@ def test_load_prompt_missing_file() -> None:
     with pytest.raises(FileNotFoundError):
         load_prompt("missing_prompt")
 
+
+def test_load_prompt_caches_bundled_prompts() -> None:
+    """Bundled prompts should only be read once until the cache is cleared."""
+    clear_prompt_cache()
+    with patch.object(
+        Path,
+        "read_text",
+        autospec=True,
+        return_value="cached",
+    ) as mock_read:
+        first = load_prompt("coding_agent")
+        second = load_prompt("coding_agent")
+
+    assert first == second == "cached"
+    mock_read.assert_called_once()
+    clear_prompt_cache()
@@ -1,17 +1,27 @@
 """Unit tests for core agent orchestration."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from clean_interfaces.core import (
     AgentConfigurationError,
     AgentExecutionError,
+    clear_response_cache,
     run_coding_agent,
+    run_coding_agent_many,
     run_repository_qa_agent,
     run_serena_coder_agent,
+    run_tdd_workflow,
+    stream_coding_agent,
 )
+from clean_interfaces.core import (
+    _coerce_response_to_string,  # pyright: ignore[reportPrivateUsage]
+    _response_extractors,  # pyright: ignore[reportPrivateUsage]
+)
+from clean_interfaces.utils.settings import AgentSettings
 
 
 def test_run_coding_agent_requires_api_key() -> None:
@@ -30,10 +40,11 @@ def test_run_coding_agent_invokes_agent_successfully() -> None:
     with (
         patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
         patch("clean_interfaces.core.load_prompt") as mock_load_prompt,
-        patch("clean_interfaces.core.create_coding_agent") as mock_create_agent,
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
     ):
         settings = MagicMock()
         settings.openai_api_key = "sk-test"
+        settings.response_cache_ttl_sec = 0
         mock_get_settings.return_value = settings
 
         mock_load_prompt.return_value = "Prompt instructions"
@@ -48,7 +59,7 @@ def test_run_coding_agent_invokes_agent_successfully() -> None:
 
         mock_load_prompt.assert_called_once_with("coding_agent")
         mock_create_agent.assert_called_once()
-        agent_instance.run.assert_called_once_with("Write code")
+        agent_instance.run.assert_called_once_with("Write code", stream=False)
         assert response == "Agent says hi"
 
 
@@ -57,10 +68,11 @@ def test_run_coding_agent_wraps_execution_errors() -> None:
     with (
         patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
         patch("clean_interfaces.core.load_prompt") as mock_load_prompt,
-        patch("clean_interfaces.core.create_coding_agent") as mock_create_agent,
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
     ):
         settings = MagicMock()
         settings.openai_api_key = "sk-test"
+        settings.response_cache_ttl_sec = 0
         mock_get_settings.return_value = settings
         mock_load_prompt.return_value = "Prompt instructions"
 
@@ -72,6 +84,103 @@ def test_run_coding_agent_wraps_execution_errors() -> None:
             run_coding_agent("Write code")
 
 
+def test_run_coding_agent_reuses_cached_responses() -> None:
+    """Identical prompts should hit the response cache when it is enabled."""
+    clear_response_cache()
+    settings = AgentSettings.model_validate(
+        {"OPENAI_API_KEY": "sk-test", "response_cache_ttl_sec": 60},
+    )
+    with (
+        patch("clean_interfaces.core.get_agent_settings", return_value=settings),
+        patch("clean_interfaces.core.load_prompt", return_value="Prompt"),
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
+    ):
+        agent_instance = MagicMock()
+        agent_instance.run.return_value = "cached answer"
+        mock_create_agent.return_value = agent_instance
+
+        first = run_coding_agent("Write code")
+        second = run_coding_agent("  Write code\n")
+
+    assert first == second == "cached answer"
+    agent_instance.run.assert_called_once()
+    clear_response_cache()
+
+
+def test_stream_coding_agent_yields_content_deltas() -> None:
+    """Streaming should yield content deltas and skip completion events."""
+    with (
+        patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
+        patch("clean_interfaces.core.load_prompt", return_value="Prompt"),
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
+    ):
+        settings = MagicMock()
+        settings.openai_api_key = "sk-test"
+        mock_get_settings.return_value = settings
+
+        agent_instance = MagicMock()
+        agent_instance.run.return_value = iter(
+            [
+                SimpleNamespace(event="RunStarted", content=None),
+                SimpleNamespace(event="RunContent", content="Hello, "),
+                SimpleNamespace(event="RunContent", content="world"),
+                SimpleNamespace(event="RunCompleted", content="Hello, world"),
+            ],
+        )
+        mock_create_agent.return_value = agent_instance
+
+        chunks = list(stream_coding_agent("Say hello"))
+
+    agent_instance.run.assert_called_once_with("Say hello", stream=True)
+    assert chunks == ["Hello, ", "world"]
+
+
+def test_run_coding_agent_many_fans_out_with_one_agent() -> None:
+    """Batched runs should build one agent and keep responses in prompt order."""
+    with (
+        patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
+        patch("clean_interfaces.core.load_prompt", return_value="Prompt"),
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
+    ):
+        settings = MagicMock()
+        settings.openai_api_key = "sk-test"
+        settings.max_concurrent_llm_calls = 2
+        mock_get_settings.return_value = settings
+
+        def _reply(prompt: str, **_: object) -> str:
+            return f"re: {prompt}"
+
+        agent_instance = MagicMock()
+        agent_instance.arun = AsyncMock(side_effect=_reply)
+        mock_create_agent.return_value = agent_instance
+
+        responses = run_coding_agent_many(["one", "two", "three"])
+
+    mock_create_agent.assert_called_once()
+    assert agent_instance.arun.await_count == 3
+    assert responses == ["re: one", "re: two", "re: three"]
+
+
+def test_run_coding_agent_many_wraps_failures() -> None:
+    """A failing prompt should surface as an AgentExecutionError."""
+    with (
+        patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
+        patch("clean_interfaces.core.load_prompt", return_value="Prompt"),
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
+    ):
+        settings = MagicMock()
+        settings.openai_api_key = "sk-test"
+        settings.max_concurrent_llm_calls = 4
+        mock_get_settings.return_value = settings
+
+        agent_instance = MagicMock()
+        agent_instance.arun = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_create_agent.return_value = agent_instance
+
+        with pytest.raises(AgentExecutionError):
+            run_coding_agent_many(["one", "two"])
+
+
 def test_run_repo_agent_requires_api_key() -> None:
     """The repository QA agent should validate configuration before running."""
     with patch("clean_interfaces.core.get_agent_settings") as mock_get_settings:
@@ -89,7 +198,9 @@ def test_run_repo_agent_invokes_agent_successfully(tmp_path: Path) -> None:
         patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
         patch("clean_interfaces.core.get_mcp_settings") as mock_get_mcp_settings,
         patch("clean_interfaces.core.load_prompt") as mock_load_prompt,
-        patch("clean_interfaces.core.create_repository_qa_agent") as mock_create_agent,
+        patch(
+            "clean_interfaces.agents.create_repository_qa_agent",
+        ) as mock_create_agent,
     ):
         settings = MagicMock()
         settings.openai_api_key = "sk-test"
@@ -107,7 +218,7 @@ def test_run_repo_agent_invokes_agent_successfully(tmp_path: Path) -> None:
 
         mock_load_prompt.assert_called_once_with("repository_qa_agent")
         mock_create_agent.assert_called_once()
-        agent_instance.run.assert_called_once_with("Where is config?")
+        agent_instance.run.assert_called_once_with("Where is config?", stream=False)
         assert response == "Repo answer"
 
 
@@ -117,7 +228,9 @@ def test_run_repo_agent_wraps_execution_errors(tmp_path: Path) -> None:
         patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
         patch("clean_interfaces.core.get_mcp_settings") as mock_get_mcp_settings,
         patch("clean_interfaces.core.load_prompt") as mock_load_prompt,
-        patch("clean_interfaces.core.create_repository_qa_agent") as mock_create_agent,
+        patch(
+            "clean_interfaces.agents.create_repository_qa_agent",
+        ) as mock_create_agent,
     ):
         settings = MagicMock()
         settings.openai_api_key = "sk-test"
@@ -150,7 +263,7 @@ def test_run_serena_agent_invokes_agent_successfully(tmp_path: Path) -> None:
         patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
         patch("clean_interfaces.core.get_mcp_settings") as mock_get_mcp_settings,
         patch("clean_interfaces.core.load_prompt") as mock_load_prompt,
-        patch("clean_interfaces.core.create_serena_coder_agent") as mock_create_agent,
+        patch("clean_interfaces.agents.create_serena_coder_agent") as mock_create_agent,
     ):
         settings = MagicMock()
         settings.openai_api_key = "sk-test"
@@ -168,7 +281,7 @@ def test_run_serena_agent_invokes_agent_successfully(tmp_path: Path) -> None:
 
         mock_load_prompt.assert_called_once_with("serena_coder_agent")
         mock_create_agent.assert_called_once()
-        agent_instance.run.assert_called_once_with("Add feature")
+        agent_instance.run.assert_called_once_with("Add feature", stream=False)
         assert response == "Serena response"
 
 
@@ -178,7 +291,7 @@ def test_run_serena_agent_wraps_execution_errors(tmp_path: Path) -> None:
         patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
         patch("clean_interfaces.core.get_mcp_settings") as mock_get_mcp_settings,
         patch("clean_interfaces.core.load_prompt") as mock_load_prompt,
-        patch("clean_interfaces.core.create_serena_coder_agent") as mock_create_agent,
+        patch("clean_interfaces.agents.create_serena_coder_agent") as mock_create_agent,
     ):
         settings = MagicMock()
         settings.openai_api_key = "sk-test"
@@ -192,3 +305,54 @@ def test_run_serena_agent_wraps_execution_errors(tmp_path: Path) -> None:
 
         with pytest.raises(AgentExecutionError):
             run_serena_coder_agent("Add feature", project_path=tmp_path)
+
+
+def test_run_tdd_workflow_shares_one_coding_agent() -> None:
+    """Test-writing and implementation steps should reuse a single agent."""
+    with (
+        patch("clean_interfaces.core.get_agent_settings") as mock_get_settings,
+        patch("clean_interfaces.core.load_prompt", return_value="Coding prompt"),
+        patch("clean_interfaces.agents.create_coding_agent") as mock_create_agent,
+        patch("clean_interfaces.workflow.create_tdd_workflow") as mock_create_workflow,
+    ):
+        settings = MagicMock()
+        settings.openai_api_key = "sk-test"
+        mock_get_settings.return_value = settings
+
+        def _reply(prompt: str, **_: object) -> str:
+            return f"done: {prompt}"
+
+        agent_instance = MagicMock()
+        agent_instance.run.side_effect = _reply
+        mock_create_agent.return_value = agent_instance
+
+        run_tdd_workflow(
+            exploration_prompt="Explore",
+            test_prompt="Write tests",
+            implementation_prompt="Implement",
+            test_command="pytest",
+        )
+
+        runners = mock_create_workflow.call_args.kwargs
+        assert runners["test_writer_runner"]("tests") == "done: tests"
+        assert runners["implementation_runner"]("code") == "done: code"
+
+    mock_create_agent.assert_called_once()
+    mock_create_workflow.return_value.run.assert_called_once()
+
+
+def test_coerce_response_to_string_specialises_per_type() -> None:
+    """Responses exposing get_content_as_string should reuse a cached extractor."""
+
+    class FakeRunOutput:
+        def __init__(self, content: object) -> None:
+            self.content = content
+
+        def get_content_as_string(self) -> object:
+            return self.content
+
+    assert _coerce_response_to_string(FakeRunOutput("text")) == "text"
+    assert FakeRunOutput in _response_extractors
+    assert _coerce_response_to_string(FakeRunOutput(42)) == "42"
+    assert _coerce_response_to_string("plain") == "plain"
+    assert _coerce_response_to_string(None) == "None"
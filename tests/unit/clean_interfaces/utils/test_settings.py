@@ -120,6 +120,18 @@ class TestLoggingSettings:
         finally:
             os.environ.pop("LOG_FORMAT", None)
 
+    def test_log_level_and_format_are_case_insensitive(self) -> None:
+        """Mixed-case values should be normalised to the canonical choices."""
+        os.environ["LOG_LEVEL"] = "debug"
+        os.environ["LOG_FORMAT"] = "Console"
+        try:
+            settings = LoggingSettings()
+            assert settings.log_level == "DEBUG"
+            assert settings.log_format == "console"
+        finally:
+            os.environ.pop("LOG_LEVEL", None)
+            os.environ.pop("LOG_FORMAT", None)
+
     def test_otel_export_enabled_property(self) -> None:
         """Test otel_export_enabled property logic."""
         # File mode - export disabled
@@ -241,6 +253,14 @@ class TestInterfaceSettings:
         # Clean up
         reset_interface_settings()
 
+    def test_interface_settings_are_frozen(self) -> None:
+        """Settings instances should reject assignment after construction."""
+        from clean_interfaces.utils.settings import InterfaceSettings
+
+        settings = InterfaceSettings()
+        with pytest.raises(ValidationError):
+            settings.interface_type = "restapi"
+
     def test_interface_settings_model_dump(self) -> None:
         """Test interface settings can be dumped to dict."""
         from clean_interfaces.utils.settings import InterfaceSettings
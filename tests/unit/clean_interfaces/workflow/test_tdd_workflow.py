@@ -91,3 +91,56 @@ def test_create_tdd_workflow_runs_sequential_steps(
     final_content = getattr(step_results[-1], "content", None)
     assert isinstance(final_content, str)
     assert "Tests behaved as expected" in final_content
+
+
+def test_create_tdd_workflow_pipes_test_stages_when_configured(
+    monkeypatch: Any,
+) -> None:
+    """It runs the test command as a pipeline when ``pipeline_tests`` is set."""
+    config = TDDWorkflowConfig(
+        exploration_prompt="Explore the repository",
+        test_prompt="Write tests for the feature",
+        implementation_prompt="Implement the feature",
+        test_command="pipe",
+        pipeline_tests=True,
+    )
+    piped: list[str] = []
+
+    def fake_run_pipeline(
+        _self: object,
+        command_spec: str,
+        *,
+        timeout: float | None = None,
+    ) -> TestCommandResult:
+        assert timeout is None
+        piped.append(command_spec)
+        return TestCommandResult(
+            command=("ls", "|", "pytest"),
+            returncode=0,
+            stdout="passing tests",
+            stderr="",
+            duration=0.1,
+        )
+
+    def fail_run(*_args: object, **_kwargs: object) -> TestCommandResult:
+        message = "run() should not be used for pipelined tests"
+        raise AssertionError(message)
+
+    monkeypatch.setattr(
+        "clean_interfaces.workflow.test_commands.TestCommandExecutor.run_pipeline",
+        fake_run_pipeline,
+    )
+    monkeypatch.setattr(
+        "clean_interfaces.workflow.test_commands.TestCommandExecutor.run",
+        fail_run,
+    )
+
+    workflow = create_tdd_workflow(
+        config=config,
+        exploration_runner=lambda _prompt, _path: "exploration summary",
+        test_writer_runner=lambda _prompt: "coding output",
+    )
+
+    workflow.run()
+
+    assert piped == ["pipe", "pipe"]
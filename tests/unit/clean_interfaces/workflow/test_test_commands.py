@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import shlex
 import sys
 from types import SimpleNamespace
 from typing import Any
 
+import pytest
+
 from clean_interfaces.workflow.test_commands import (
     TestCommandExecutor,
     TestCommandManager,
@@ -111,3 +115,87 @@ def test_result_format_includes_outputs() -> None:
     prompt_block = result.to_prompt_block()
     assert "example output" in prompt_block
     assert "example error" in prompt_block
+
+
+def test_executor_run_all_concurrent_preserves_command_order() -> None:
+    """It runs every command concurrently and keeps results in spec order."""
+    manager = TestCommandManager(include_defaults=False)
+    manager.register(
+        "checks",
+        [
+            [sys.executable, "-c", "import time; time.sleep(0.2); print('slow')"],
+            [sys.executable, "-c", "import sys; print('fast', file=sys.stderr)"],
+        ],
+    )
+
+    executor = TestCommandExecutor(manager)
+    results = asyncio.run(executor.run_all_concurrent("checks"))
+
+    assert len(results) == 2
+    assert all(result.succeeded for result in results)
+    assert "slow" in results[0].stdout
+    assert "fast" in results[1].stderr
+
+
+def test_executor_run_pipeline_streams_between_stages() -> None:
+    """It feeds each stage's stdout into the next and reports one result."""
+    manager = TestCommandManager(include_defaults=False)
+    manager.register(
+        "pipe",
+        [
+            [
+                sys.executable,
+                "-c",
+                "import sys; print('alpha\\nbeta'); print('warn', file=sys.stderr)",
+            ],
+            [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+        ],
+    )
+
+    executor = TestCommandExecutor(manager)
+    result = executor.run_pipeline("pipe")
+
+    assert result.succeeded
+    assert "ALPHA\nBETA" in result.stdout
+    assert "warn" in result.stderr
+    assert "|" in result.command
+
+
+def test_executor_run_pipeline_splits_command_strings_on_pipes() -> None:
+    """It treats bare ``|`` tokens in a command string as stage separators."""
+    producer = shlex.join([sys.executable, "-c", "print('alpha')"])
+    consumer = shlex.join(
+        [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+    )
+
+    executor = TestCommandExecutor(TestCommandManager(include_defaults=False))
+    result = executor.run_pipeline(f"{producer} | {consumer}")
+
+    assert result.succeeded
+    assert result.stdout.strip() == "ALPHA"
+
+
+def test_executor_run_pipeline_rejects_empty_stages() -> None:
+    """It refuses command strings with a dangling ``|``."""
+    executor = TestCommandExecutor(TestCommandManager(include_defaults=False))
+
+    with pytest.raises(ValueError, match="Pipeline stages cannot be empty"):
+        executor.run_pipeline("pytest |")
+
+
+def test_executor_run_pipeline_reports_rightmost_failure() -> None:
+    """It surfaces the rightmost failing stage, like ``set -o pipefail``."""
+    manager = TestCommandManager(include_defaults=False)
+    manager.register(
+        "pipe",
+        [
+            [sys.executable, "-c", "raise SystemExit(3)"],
+            [sys.executable, "-c", "import sys; sys.stdin.read(); sys.exit(5)"],
+            [sys.executable, "-c", "import sys; sys.stdin.read()"],
+        ],
+    )
+
+    executor = TestCommandExecutor(manager)
+    result = executor.run_pipeline("pipe")
+
+    assert result.returncode == 5